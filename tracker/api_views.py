@@ -2,12 +2,26 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Sum, Count, Q
+from django.http import StreamingHttpResponse
+from django.db.models import Sum, Count, Max, Q
+from django.db.models.functions import TruncMonth
+from django.core.cache import cache
 from django.utils import timezone
-from datetime import timedelta, datetime
-from .models import Category, Expense, Budget, FinancialGoal
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+import hashlib
+from datetime import datetime, time
+from decimal import Decimal, InvalidOperation
+from .models import (
+    Category, Expense, Budget, FinancialGoal,
+    CATEGORY_LIST_CACHE_TIMEOUT, category_list_cache_key,
+    DASHBOARD_STATS_CACHE_TIMEOUT, dashboard_stats_cache_key
+)
+from .pagination import DateCursorPagination, ExpenseCountPagination
+from .renderers import ORJSONRenderer
+from .utils import month_start
 from .serializers import (
-    CategorySerializer, ExpenseSerializer, BudgetSerializer, FinancialGoalSerializer,
+    CategorySerializer, ExpenseSerializer, ExpenseListSerializer, BudgetSerializer, FinancialGoalSerializer,
     ExpenseSummarySerializer, CategorySummarySerializer, MonthlyTrendSerializer,
     BudgetProgressSerializer, ExpenseFilterSerializer, DateRangeSerializer
 )
@@ -21,47 +35,117 @@ class CategoryViewSet(viewsets.ModelViewSet):
     
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
+    
+    def list(self, request, *args, **kwargs):
+        # Categories rarely change; signals in models.py drop the entry on writes
+        data = cache.get_or_set(
+            category_list_cache_key(request.user.id),
+            lambda: list(self.get_serializer(self.get_queryset(), many=True).data),
+            CATEGORY_LIST_CACHE_TIMEOUT
+        )
+        
+        page = self.paginate_queryset(data)
+        if page is not None:
+            return self.get_paginated_response(page)
+        
+        return Response(data)
 
 class ExpenseViewSet(viewsets.ModelViewSet):
     serializer_class = ExpenseSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = ExpenseCountPagination
     
     def get_queryset(self):
-        return Expense.objects.filter(user=self.request.user).select_related('category').order_by('-date')
+        queryset = Expense.objects.filter(user=self.request.user)
+        return self.get_serializer_class().setup_eager_loading(queryset)
     
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
     
+    @property
+    def paginator(self):
+        # Clients that send a cursor (an empty one starts at the top) get keyset pages instead of OFFSET ones
+        if not hasattr(self, '_paginator') and 'cursor' in self.request.query_params:
+            self._paginator = DateCursorPagination()
+        return super().paginator
+    
+    def list(self, request, *args, **kwargs):
+        # Repeat polls of an unchanged list get a 304 without running the list query or serializing
+        etag = self.get_list_etag(request)
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = self.list_rows(request)
+        
+        response['ETag'] = etag
+        patch_vary_headers(response, ('Authorization',))
+        return response
+    
+    def get_list_etag(self, request):
+        """Weak ETag for the user's expense list, changing on any add, edit, delete or category edit"""
+        stamp = Expense.objects.filter(user=request.user).aggregate(
+            count=Count('id'),
+            updated=Max('updated_at'),
+            category_updated=Max('category__updated_at')
+        )
+        # The query string picks the page, cursor and filters, so it is part of the representation
+        version = f"{stamp['count']}:{stamp['updated']}:{stamp['category_updated']}:{request.get_full_path()}"
+        return f'W/"{hashlib.md5(version.encode()).hexdigest()}"'
+    
+    def list_rows(self, request):
+        # Listing is read-only, so serialize plain rows instead of model instances
+        queryset = self.filter_queryset(self.get_queryset()).order_by('-date').values(
+            *ExpenseListSerializer.value_fields
+        )
+        
+        if request.query_params.get('stream') == '1':
+            # Skip pagination and stream the whole list as one JSON array, a chunk of rows at a time
+            def stream_expenses():
+                renderer = ORJSONRenderer()
+                separator = b'['
+                for row in queryset.iterator(chunk_size=1000):
+                    yield separator + renderer.render(ExpenseListSerializer(row).data)
+                    separator = b','
+                yield b']' if separator == b',' else b'[]'
+            
+            return StreamingHttpResponse(stream_expenses(), content_type='application/json')
+        
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = ExpenseListSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        
+        serializer = ExpenseListSerializer(queryset, many=True)
+        return Response(serializer.data)
+    
     @action(detail=False, methods=['get'])
     def summary(self, request):
         """Get expense summary for the current user"""
         try:
             today = timezone.now()
-            start_of_month = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            start_of_month = month_start(today)
             
-            # Monthly totals with proper aggregation handling
-            monthly_expenses_data = self.get_queryset().filter(
-                category__type='expense',
-                date__gte=start_of_month
-            ).aggregate(total=Sum('amount'))
-            monthly_expenses = monthly_expenses_data['total'] or 0
-            
-            monthly_income_data = self.get_queryset().filter(
-                category__type='income',
-                date__gte=start_of_month
-            ).aggregate(total=Sum('amount'))
-            monthly_income = monthly_income_data['total'] or 0
+            # Aggregates need neither the category join nor the list ordering
+            expenses = Expense.objects.filter(user=request.user)
             
-            # Counts
-            expense_count = self.get_queryset().filter(category__type='expense').count()
-            income_count = self.get_queryset().filter(category__type='income').count()
+            # Monthly totals and overall counts in a single query
+            totals = expenses.aggregate(
+                total_expenses=Sum('amount', filter=Q(category__type='expense', date__gte=start_of_month)),
+                total_income=Sum('amount', filter=Q(category__type='income', date__gte=start_of_month)),
+                expense_count=Count('id', filter=Q(category__type='expense')),
+                income_count=Count('id', filter=Q(category__type='income'))
+            )
+            monthly_expenses = totals['total_expenses'] or 0
+            monthly_income = totals['total_income'] or 0
+            net_savings = monthly_income - monthly_expenses
             
             summary = {
                 'total_expenses': monthly_expenses,
                 'total_income': monthly_income,
-                'net_savings': monthly_income - monthly_expenses,
-                'expense_count': expense_count,
-                'income_count': income_count,
+                'net_savings': net_savings,
+                'expense_count': totals['expense_count'],
+                'income_count': totals['income_count'],
+                'savings_rate': round(net_savings / monthly_income * 100, 2) if monthly_income > 0 else 0,
             }
             
             serializer = ExpenseSummarySerializer(summary)
@@ -78,19 +162,21 @@ class ExpenseViewSet(viewsets.ModelViewSet):
         """Get expenses grouped by category"""
         try:
             today = timezone.now()
-            start_of_month = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            start_of_month = month_start(today)
             
-            category_data = self.get_queryset().filter(
+            monthly_expenses = Expense.objects.filter(
+                user=request.user,
                 category__type='expense',
                 date__gte=start_of_month
-            ).values('category__name', 'category__color').annotate(
+            )
+            category_data = monthly_expenses.values('category__name', 'category__color').annotate(
                 total_amount=Sum('amount'),
                 transaction_count=Count('id')
             ).order_by('-total_amount')
             
-            # Convert to list and handle empty case
+            # Every expense falls in exactly one group, so the groups add up to the monthly total
             category_list = list(category_data)
-            total_expenses = sum(item['total_amount'] for item in category_list if item['total_amount'])
+            total_expenses = sum(item['total_amount'] for item in category_list)
             
             result = []
             for item in category_list:
@@ -120,24 +206,38 @@ class ExpenseViewSet(viewsets.ModelViewSet):
             if not filter_serializer.is_valid():
                 return Response(filter_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
             
-            queryset = self.get_queryset()
             filters = filter_serializer.validated_data
+            tz = timezone.get_current_timezone()
             
+            # Combine every criterion first so the queryset is filtered once
+            conditions = Q()
             if filters.get('category'):
-                queryset = queryset.filter(category_id=filters['category'])
+                conditions &= Q(category_id=filters['category'])
             if filters.get('start_date'):
                 # Fix: Proper datetime filtering with timezone
-                start_datetime = timezone.make_aware(datetime.combine(filters['start_date'], datetime.min.time()))
-                queryset = queryset.filter(date__gte=start_datetime)
+                start_datetime = datetime.combine(filters['start_date'], time.min, tzinfo=tz)
+                conditions &= Q(date__gte=start_datetime)
             if filters.get('end_date'):
-                end_datetime = timezone.make_aware(datetime.combine(filters['end_date'], datetime.max.time()))
-                queryset = queryset.filter(date__lte=end_datetime)
+                end_datetime = datetime.combine(filters['end_date'], time.max, tzinfo=tz)
+                conditions &= Q(date__lte=end_datetime)
             if filters.get('payment_method'):
-                queryset = queryset.filter(payment_method=filters['payment_method'])
+                conditions &= Q(payment_method=filters['payment_method'])
             if filters.get('min_amount'):
-                queryset = queryset.filter(amount__gte=filters['min_amount'])
+                conditions &= Q(amount__gte=filters['min_amount'])
             if filters.get('max_amount'):
-                queryset = queryset.filter(amount__lte=filters['max_amount'])
+                conditions &= Q(amount__lte=filters['max_amount'])
+            
+            queryset = self.get_queryset().filter(conditions)
+            
+            if request.query_params.get('stream') == '1':
+                # Skip pagination and stream one JSON object per line in chunks
+                # rather than building the whole result list in memory
+                def stream_expenses():
+                    renderer = ORJSONRenderer()
+                    for expense in queryset.iterator(chunk_size=2000):
+                        yield renderer.render(self.get_serializer(expense).data) + b'\n'
+                
+                return StreamingHttpResponse(stream_expenses(), content_type='application/x-ndjson')
             
             page = self.paginate_queryset(queryset)
             if page is not None:
@@ -158,7 +258,8 @@ class BudgetViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        return Budget.objects.filter(user=self.request.user).select_related('category')
+        queryset = Budget.objects.filter(user=self.request.user).with_spent()
+        return self.get_serializer_class().setup_eager_loading(queryset)
     
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -167,18 +268,23 @@ class BudgetViewSet(viewsets.ModelViewSet):
     def progress(self, request):
         """Get budget progress for all categories"""
         try:
-            budgets = self.get_queryset()
+            # One query returning plain rows; display names come from the choices, not Category instances
+            category_labels = dict(Category.CATEGORY_CHOICES)
+            rows = Budget.objects.filter(user=request.user).with_spent().values_list(
+                'category__name', 'amount', 'spent'
+            )
             
             progress_data = []
-            for budget in budgets:
-                spent = budget.spent_amount()
+            for name, amount, spent in rows:
+                percentage = min(spent * 100 / amount, 100) if amount > 0 else 0
                 progress_data.append({
-                    'category_name': budget.category.get_name_display(),  # Use display name
-                    'budget_amount': budget.amount,
+                    'category_name': category_labels.get(name, name),
+                    'budget_amount': amount,
                     'spent_amount': spent,
-                    'remaining_amount': budget.remaining_amount(),
-                    'progress_percentage': budget.progress_percentage(),
-                    'is_over_budget': spent > budget.amount
+                    'remaining_amount': amount - spent,
+                    'progress_percentage': percentage,
+                    'is_over_budget': spent > amount,
+                    'budget_status': Budget.status_for_percentage(percentage)
                 })
             
             serializer = BudgetProgressSerializer(progress_data, many=True)
@@ -195,7 +301,8 @@ class FinancialGoalViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        return FinancialGoal.objects.filter(user=self.request.user)
+        queryset = FinancialGoal.objects.filter(user=self.request.user).with_status()
+        return self.get_serializer_class().setup_eager_loading(queryset)
     
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -204,7 +311,6 @@ class FinancialGoalViewSet(viewsets.ModelViewSet):
     def update_progress(self, request, pk=None):
         """Update the current amount for a financial goal"""
         try:
-            goal = self.get_object()
             current_amount = request.data.get('current_amount')
             
             if current_amount is None:
@@ -214,8 +320,11 @@ class FinancialGoalViewSet(viewsets.ModelViewSet):
                 )
             
             try:
-                current_amount = float(current_amount)
-            except (TypeError, ValueError):
+                # str() first so floats in the JSON body keep their written value
+                current_amount = Decimal(str(current_amount))
+                if not current_amount.is_finite():
+                    raise InvalidOperation
+            except (TypeError, ValueError, InvalidOperation):
                 return Response(
                     {'error': 'current_amount must be a valid number'},
                     status=status.HTTP_400_BAD_REQUEST
@@ -227,16 +336,25 @@ class FinancialGoalViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            if current_amount > goal.target_amount:
+            # Check the target inside the UPDATE itself so concurrent writes can't slip past it
+            goals = self.get_queryset().filter(pk=pk)
+            updated = goals.filter(target_amount__gte=current_amount).update(
+                current_amount=current_amount,
+                updated_at=timezone.now()
+            )
+            
+            if not updated:
+                if not goals.exists():
+                    raise FinancialGoal.DoesNotExist
                 return Response(
                     {'error': 'Current amount cannot exceed target amount'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            goal.current_amount = current_amount
-            goal.save()
+            # update() skips post_save, so drop the cached dashboard figures here
+            cache.delete(dashboard_stats_cache_key(request.user.id))
             
-            serializer = self.get_serializer(goal)
+            serializer = self.get_serializer(goals.get())
             return Response(serializer.data)
         
         except FinancialGoal.DoesNotExist:
@@ -267,50 +385,40 @@ class AnalyticsViewSet(viewsets.ViewSet):
             start_date = date_serializer.validated_data['start_date']
             end_date = date_serializer.validated_data['end_date']
             
-            # Generate monthly data
+            # Sum expenses and income for every month in the range in one query
+            tz = timezone.get_current_timezone()
+            start_tz = datetime.combine(start_date, time.min, tzinfo=tz)
+            end_tz = datetime.combine(end_date, time.max, tzinfo=tz)
+            monthly_totals = Expense.objects.filter(
+                user=request.user,
+                date__range=[start_tz, end_tz]
+            ).annotate(month=TruncMonth('date')).values('month').annotate(
+                expenses=Sum('amount', filter=Q(category__type='expense')),
+                income=Sum('amount', filter=Q(category__type='income'))
+            ).order_by('month')
+            totals_by_month = {row['month'].date(): row for row in monthly_totals}
+            
+            # Emit every month in the range, zero-filling months without activity
             current_date = start_date.replace(day=1)
             monthly_data = []
             
             while current_date <= end_date:
-                # Calculate month end properly
-                if current_date.month == 12:
-                    next_month = current_date.replace(year=current_date.year + 1, month=1, day=1)
-                else:
-                    next_month = current_date.replace(month=current_date.month + 1, day=1)
-                month_end = next_month - timedelta(days=1)
-                
-                # Ensure we don't go beyond the requested end_date
-                if month_end > end_date:
-                    month_end = end_date
-                
-                # Convert to timezone-aware datetimes
-                month_start_tz = timezone.make_aware(datetime.combine(current_date, datetime.min.time()))
-                month_end_tz = timezone.make_aware(datetime.combine(month_end, datetime.max.time()))
-                
-                # Get monthly expenses
-                monthly_expenses_data = Expense.objects.filter(
-                    user=request.user,
-                    category__type='expense',
-                    date__range=[month_start_tz, month_end_tz]
-                ).aggregate(total=Sum('amount'))
-                monthly_expenses = monthly_expenses_data['total'] or 0
-                
-                # Get monthly income
-                monthly_income_data = Expense.objects.filter(
-                    user=request.user,
-                    category__type='income',
-                    date__range=[month_start_tz, month_end_tz]
-                ).aggregate(total=Sum('amount'))
-                monthly_income = monthly_income_data['total'] or 0
+                row = totals_by_month.get(current_date, {})
+                monthly_expenses = row.get('expenses') or 0
+                monthly_income = row.get('income') or 0
                 
                 monthly_data.append({
                     'month': current_date.strftime('%b %Y'),
                     'expenses': monthly_expenses,
-                    'income': monthly_income
+                    'income': monthly_income,
+                    'savings': monthly_income - monthly_expenses
                 })
                 
                 # Move to next month
-                current_date = next_month
+                if current_date.month == 12:
+                    current_date = current_date.replace(year=current_date.year + 1, month=1)
+                else:
+                    current_date = current_date.replace(month=current_date.month + 1)
             
             serializer = MonthlyTrendSerializer(monthly_data, many=True)
             return Response(serializer.data)
@@ -325,42 +433,53 @@ class AnalyticsViewSet(viewsets.ViewSet):
     def dashboard_stats(self, request):
         """Get dashboard statistics"""
         try:
-            today = timezone.now()
-            start_of_month = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            
-            # Current month stats
-            monthly_stats = Expense.objects.filter(
-                user=request.user,
-                date__gte=start_of_month
-            ).aggregate(
-                total_expenses=Sum('amount', filter=Q(category__type='expense')),
-                total_income=Sum('amount', filter=Q(category__type='income'))
+            # Cached per user; signals in models.py drop the entry on writes
+            stats = cache.get_or_set(
+                dashboard_stats_cache_key(request.user.id),
+                lambda: self._compute_dashboard_stats(request.user),
+                DASHBOARD_STATS_CACHE_TIMEOUT
             )
             
-            # Budget stats
-            budget_stats = Budget.objects.filter(user=request.user).aggregate(
-                total_budget=Sum('amount')
-            )
-            
-            # Goal stats
-            goal_stats = FinancialGoal.objects.filter(user=request.user).aggregate(
-                total_target=Sum('target_amount'),
-                total_current=Sum('current_amount')
-            )
-            
-            stats = {
-                'monthly_expenses': monthly_stats['total_expenses'] or 0,
-                'monthly_income': monthly_stats['total_income'] or 0,
-                'total_budget': budget_stats['total_budget'] or 0,
-                'total_goals_target': goal_stats['total_target'] or 0,
-                'total_goals_current': goal_stats['total_current'] or 0,
-                'net_savings': (monthly_stats['total_income'] or 0) - (monthly_stats['total_expenses'] or 0)
-            }
-            
             return Response(stats)
         
         except Exception as e:
             return Response(
                 {'error': f'Error generating dashboard stats: {str(e)}'}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
\ No newline at end of file
+            )
+    
+    def _compute_dashboard_stats(self, user):
+        """Aggregate the figures shown on the dashboard"""
+        today = timezone.now()
+        start_of_month = month_start(today)
+        
+        # Current month stats
+        monthly_stats = Expense.objects.filter(
+            user=user,
+            date__gte=start_of_month
+        ).aggregate(
+            total_expenses=Sum('amount', filter=Q(category__type='expense')),
+            total_income=Sum('amount', filter=Q(category__type='income'))
+        )
+        
+        # Budget stats
+        budget_stats = Budget.objects.filter(user=user).aggregate(
+            total_budget=Sum('amount')
+        )
+        
+        # Goal stats
+        goal_stats = FinancialGoal.objects.filter(user=user).aggregate(
+            total_target=Sum('target_amount'),
+            total_current=Sum('current_amount')
+        )
+        
+        stats = {
+            'monthly_expenses': monthly_stats['total_expenses'] or 0,
+            'monthly_income': monthly_stats['total_income'] or 0,
+            'total_budget': budget_stats['total_budget'] or 0,
+            'total_goals_target': goal_stats['total_target'] or 0,
+            'total_goals_current': goal_stats['total_current'] or 0,
+            'net_savings': (monthly_stats['total_income'] or 0) - (monthly_stats['total_expenses'] or 0)
+        }
+        
+        return stats
\ No newline at end of file
@@ -1,7 +1,13 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, PasswordResetForm, SetPasswordForm
 from django.contrib.auth.models import User
-from .models import Expense, Budget, Category, FinancialGoal, Income, UserProfile, FinancialReport, Notification
+from django.core.cache import cache
+from django.db.models import Count, Q
+from .models import Expense, Budget, Category, FinancialGoal, Income, UserProfile, FinancialReport
+from .models import (
+    CATEGORY_CHOICES_CACHE_TIMEOUT, DEFAULT_CATEGORIES_CACHE_TIMEOUT,
+    category_choices_cache_key, clear_category_caches, default_categories_cache_key
+)
 
 class CustomUserCreationForm(UserCreationForm):
     email = forms.EmailField(required=True)
@@ -47,32 +53,96 @@ class CustomSetPasswordForm(SetPasswordForm):
         })
     )
 
+# (name, type, color) for the categories every new user starts with
+DEFAULT_CATEGORIES = (
+    ('Food & Dining', 'expense', '#FF6B6B'),
+    ('Transportation', 'expense', '#4ECDC4'),
+    ('Utilities', 'expense', '#45B7D1'),
+    ('Housing/Rent', 'expense', '#96CEB4'),
+    ('Entertainment', 'expense', '#FFEAA7'),
+    ('Shopping', 'expense', '#DDA0DD'),
+    ('Healthcare', 'expense', '#98D8C8'),
+    ('Education', 'expense', '#F7DC6F'),
+    ('Travel', 'expense', '#BB8FCE'),
+    ('Salary/Income', 'income', '#82E0AA'),
+    ('Other', 'expense', '#85929E'),
+)
+
+def ensure_default_categories(users):
+    """Create default categories for every user that has none, with one SELECT and one INSERT"""
+    user_ids = [user.id for user in users]
+    have_categories = set(
+        Category.objects.filter(user_id__in=user_ids).order_by().values_list('user_id', flat=True).distinct()
+    )
+    missing_ids = [user_id for user_id in user_ids if user_id not in have_categories]
+    
+    if missing_ids:
+        # ignore_conflicts covers a concurrent request creating the same rows
+        Category.objects.bulk_create([
+            Category(user_id=user_id, name=name, type=cat_type, color=color)
+            for user_id in missing_ids
+            for name, cat_type, color in DEFAULT_CATEGORIES
+        ], batch_size=500, ignore_conflicts=True)
+        # bulk_create sends no post_save, so clear the cached category data by hand
+        for user_id in missing_ids:
+            clear_category_caches(user_id)
+    
+    cache.set_many(
+        {default_categories_cache_key(user_id): True for user_id in user_ids},
+        DEFAULT_CATEGORIES_CACHE_TIMEOUT
+    )
+
 def create_default_categories(user):
     """Create default categories for a user if they don't have any"""
-    if not Category.objects.filter(user=user).exists():
-        default_categories = [
-            ('Food & Dining', 'expense', '#FF6B6B'),
-            ('Transportation', 'expense', '#4ECDC4'),
-            ('Utilities', 'expense', '#45B7D1'),
-            ('Housing/Rent', 'expense', '#96CEB4'),
-            ('Entertainment', 'expense', '#FFEAA7'),
-            ('Shopping', 'expense', '#DDA0DD'),
-            ('Healthcare', 'expense', '#98D8C8'),
-            ('Education', 'expense', '#F7DC6F'),
-            ('Travel', 'expense', '#BB8FCE'),
-            ('Salary/Income', 'income', '#82E0AA'),
-            ('Other', 'expense', '#85929E')
-        ]
-        
-        for name, cat_type, color in default_categories:
-            Category.objects.create(
-                user=user,
-                name=name,
-                type=cat_type,
-                color=color
-            )
+    # Several forms are built per request, so remember the check on the user and in the cache
+    if getattr(user, '_default_categories_checked', False):
+        return
+    
+    if not cache.get(default_categories_cache_key(user.id)):
+        ensure_default_categories([user])
+    user._default_categories_checked = True
 
-class ExpenseForm(forms.ModelForm):
+def set_category_choices(field, user, category_type=None, limit=None):
+    """Point a category ModelChoiceField at the user's categories, rendering from cached choices"""
+    # The select and validation only need the id and the name for the label
+    categories = Category.objects.filter(user=user).only('id', 'name', 'type')
+    if category_type:
+        categories = categories.filter(type=category_type)
+    
+    def build_choices():
+        shortlist = categories
+        if limit:
+            # Most used first, sliced in the database
+            shortlist = shortlist.annotate(
+                usage=Count('expense', filter=Q(expense__user=user))
+            ).order_by('-usage', 'name')[:limit]
+        return [(category.pk, field.label_from_instance(category)) for category in shortlist]
+    
+    choices = cache.get_or_set(
+        category_choices_cache_key(user.id, category_type, limit),
+        build_choices,
+        CATEGORY_CHOICES_CACHE_TIMEOUT
+    )
+    
+    # The queryset still validates submitted values; the select renders from the cached list
+    field.queryset = categories.filter(pk__in=[pk for pk, label in choices]) if limit else categories
+    field.choices = ([('', field.empty_label)] if field.empty_label is not None else []) + choices
+
+class UserCategoryFormMixin:
+    """Takes a user kwarg and limits the form's category field to that user's categories"""
+    category_type = None
+    category_limit = None
+    
+    def __init__(self, *args, **kwargs):
+        user = kwargs.pop('user', None)
+        super().__init__(*args, **kwargs)
+        if user:
+            create_default_categories(user)
+            set_category_choices(self.fields['category'], user, self.category_type, self.category_limit)
+
+class ExpenseForm(UserCategoryFormMixin, forms.ModelForm):
+    category_type = 'expense'
+    
     class Meta:
         model = Expense
         fields = ['amount', 'description', 'category', 'payment_method', 'notes', 'date']
@@ -82,15 +152,10 @@ class ExpenseForm(forms.ModelForm):
             'description': forms.TextInput(attrs={'placeholder': 'Enter expense description'}),
             'amount': forms.NumberInput(attrs={'placeholder': '0.00', 'step': '0.01'}),
         }
-    
-    def __init__(self, *args, **kwargs):
-        user = kwargs.pop('user', None)
-        super().__init__(*args, **kwargs)
-        if user:
-            create_default_categories(user)
-            self.fields['category'].queryset = Category.objects.filter(user=user, type='expense')
 
-class BudgetForm(forms.ModelForm):
+class BudgetForm(UserCategoryFormMixin, forms.ModelForm):
+    category_type = 'expense'
+    
     class Meta:
         model = Budget
         fields = ['category', 'amount', 'period', 'start_date', 'end_date']
@@ -99,13 +164,6 @@ class BudgetForm(forms.ModelForm):
             'end_date': forms.DateInput(attrs={'type': 'date'}),
             'amount': forms.NumberInput(attrs={'placeholder': '0.00', 'step': '0.01'}),
         }
-    
-    def __init__(self, *args, **kwargs):
-        user = kwargs.pop('user', None)
-        super().__init__(*args, **kwargs)
-        if user:
-            create_default_categories(user)
-            self.fields['category'].queryset = Category.objects.filter(user=user, type='expense')
 
 class FinancialGoalForm(forms.ModelForm):
     class Meta:
@@ -125,7 +183,7 @@ class FinancialGoalForm(forms.ModelForm):
         
         if target_amount and current_amount:
             if current_amount > target_amount:
-                raise forms.ValidationError("Current amount cannot exceed target amount.")
+                self.add_error('current_amount', "Current amount cannot exceed target amount.")
         
         return cleaned_data
 
@@ -139,7 +197,11 @@ class CategoryForm(forms.ModelForm):
             'icon': forms.TextInput(attrs={'placeholder': 'Enter icon name (e.g., shopping-cart)'}),
         }
 
-class ExpenseFilterForm(forms.Form):
+# Filter choices are built once at import and shared by every form instance
+PAYMENT_METHOD_FILTER_CHOICES = (('', 'All Methods'),) + tuple(Expense.PAYMENT_METHODS)
+INCOME_SOURCE_FILTER_CHOICES = (('', 'All Sources'),) + tuple(Income.INCOME_SOURCES)
+
+class ExpenseFilterForm(UserCategoryFormMixin, forms.Form):
     category = forms.ModelChoiceField(
         queryset=Category.objects.none(),
         required=False,
@@ -154,16 +216,9 @@ class ExpenseFilterForm(forms.Form):
         widget=forms.DateInput(attrs={'type': 'date'})
     )
     payment_method = forms.ChoiceField(
-        choices=[('', 'All Methods')] + Expense.PAYMENT_METHODS,
+        choices=PAYMENT_METHOD_FILTER_CHOICES,
         required=False
     )
-    
-    def __init__(self, *args, **kwargs):
-        user = kwargs.pop('user', None)
-        super().__init__(*args, **kwargs)
-        if user:
-            create_default_categories(user)
-            self.fields['category'].queryset = Category.objects.filter(user=user)
 
 class IncomeForm(forms.ModelForm):
     class Meta:
@@ -190,13 +245,13 @@ class IncomeForm(forms.ModelForm):
         recurrence_pattern = cleaned_data.get('recurrence_pattern')
         
         if is_recurring and recurrence_pattern == 'NONE':
-            raise forms.ValidationError("Please select a recurrence pattern for recurring income.")
+            self.add_error('recurrence_pattern', "Please select a recurrence pattern for recurring income.")
         
         return cleaned_data
 
 class IncomeFilterForm(forms.Form):
     source = forms.ChoiceField(
-        choices=[('', 'All Sources')] + Income.INCOME_SOURCES,
+        choices=INCOME_SOURCE_FILTER_CHOICES,
         required=False
     )
     start_date = forms.DateField(
@@ -208,7 +263,24 @@ class IncomeFilterForm(forms.Form):
         widget=forms.DateInput(attrs={'type': 'date'})
     )
 
+# Timezones offered on the profile page, built once at import
+TIMEZONE_CHOICES = (
+    ('UTC', 'UTC'),
+    ('America/New_York', 'New York'),
+    ('America/Los_Angeles', 'Los Angeles'),
+    ('Europe/London', 'London'),
+    ('Europe/Paris', 'Paris'),
+    ('Asia/Tokyo', 'Tokyo'),
+    ('Asia/Kolkata', 'India'),
+    ('Africa/Addis_Ababa', 'Addis Ababa'),
+)
+
 class UserProfileForm(forms.ModelForm):
+    timezone = forms.ChoiceField(
+        choices=TIMEZONE_CHOICES,
+        widget=forms.Select(attrs={'class': 'form-select'})
+    )
+    
     class Meta:
         model = UserProfile
         fields = ['currency', 'theme', 'language', 'timezone', 'receive_email_notifications', 
@@ -217,22 +289,7 @@ class UserProfileForm(forms.ModelForm):
             'currency': forms.Select(attrs={'class': 'form-select'}),
             'theme': forms.Select(attrs={'class': 'form-select'}),
             'language': forms.Select(attrs={'class': 'form-select'}),
-            'timezone': forms.Select(attrs={'class': 'form-select'}),
         }
-    
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Add timezone choices dynamically (you can populate this from pytz.common_timezones)
-        self.fields['timezone'].choices = [
-            ('UTC', 'UTC'),
-            ('America/New_York', 'New York'),
-            ('America/Los_Angeles', 'Los Angeles'),
-            ('Europe/London', 'London'),
-            ('Europe/Paris', 'Paris'),
-            ('Asia/Tokyo', 'Tokyo'),
-            ('Asia/Kolkata', 'India'),
-            ('Africa/Addis_Ababa', 'Addis Ababa'),
-        ]
 
 class FinancialReportForm(forms.ModelForm):
     report_format = forms.ChoiceField(
@@ -258,12 +315,15 @@ class FinancialReportForm(forms.ModelForm):
         
         if start_date and end_date:
             if start_date > end_date:
-                raise forms.ValidationError("Start date cannot be after end date.")
+                self.add_error('end_date', "Start date cannot be after end date.")
         
         return cleaned_data
 
-class QuickExpenseForm(forms.ModelForm):
+class QuickExpenseForm(UserCategoryFormMixin, forms.ModelForm):
     """Form for quick expense entry (simplified)"""
+    category_type = 'expense'
+    category_limit = 5  # Limit to top 5 categories
+    
     class Meta:
         model = Expense
         fields = ['amount', 'description', 'category']
@@ -278,13 +338,6 @@ class QuickExpenseForm(forms.ModelForm):
                 'class': 'form-control-lg'
             }),
         }
-    
-    def __init__(self, *args, **kwargs):
-        user = kwargs.pop('user', None)
-        super().__init__(*args, **kwargs)
-        if user:
-            create_default_categories(user)
-            self.fields['category'].queryset = Category.objects.filter(user=user, type='expense')[:5]  # Limit to top 5 categories
 
 class QuickIncomeForm(forms.ModelForm):
     """Form for quick income entry (simplified)"""
@@ -454,6 +507,6 @@ class DateRangeFilterForm(forms.Form):
         end_date = cleaned_data.get('end_date')
         
         if start_date and end_date and start_date > end_date:
-            raise forms.ValidationError("Start date cannot be after end date.")
+            self.add_error('end_date', "Start date cannot be after end date.")
         
         return cleaned_data
\ No newline at end of file
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0003_expense_tracker_exp_user_id_bcd9ed_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='budget',
+            index=models.Index(fields=['user', 'start_date'], name='tracker_bud_user_id_b850a0_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0004_budget_tracker_bud_user_id_b850a0_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='income',
+            index=models.Index(fields=['user', 'date'], name='tracker_inc_user_id_5894af_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='income',
+            index=models.Index(fields=['user', 'is_recurring', 'recurrence_pattern'], name='tracker_inc_user_id_f21af9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'is_read', '-created_at'], name='tracker_not_user_id_6bf6f3_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0006_alter_financialreport_generated_at_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['user', 'type'], name='tracker_cat_user_id_c68c2e_idx'),
+        ),
+    ]
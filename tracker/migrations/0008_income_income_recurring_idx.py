@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0007_category_tracker_cat_user_id_c68c2e_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='income',
+            index=models.Index(condition=models.Q(('is_recurring', True)), fields=['recurrence_pattern', 'date'], name='income_recurring_idx'),
+        ),
+    ]
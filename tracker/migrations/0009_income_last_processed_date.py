@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0008_income_income_recurring_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='income',
+            name='last_processed_date',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0009_income_last_processed_date'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='income',
+            name='income_recurring_idx',
+        ),
+        migrations.AddIndex(
+            model_name='income',
+            index=models.Index(condition=models.Q(('is_recurring', True)), fields=['recurrence_pattern', 'last_processed_date', 'date'], name='income_recurring_idx'),
+        ),
+    ]
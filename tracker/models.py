@@ -1,9 +1,12 @@
 from django.db import models
+from django.db.models import Sum, OuterRef, Subquery, Value, F, Q, Case, When, ExpressionWrapper
+from django.db.models.functions import Cast, Coalesce, Greatest
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator
 from django.utils import timezone
 from django.urls import reverse
-from datetime import date
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
 
 class Category(models.Model):
     CATEGORY_TYPES = [
@@ -36,10 +39,18 @@ class Category(models.Model):
         verbose_name_plural = "Categories"
         ordering = ['name']
         unique_together = ['user', 'name']
+        indexes = [
+            models.Index(fields=['user', 'type']),
+        ]
     
     def __str__(self):
         return self.get_name_display()
 
+class ExpenseManager(models.Manager):
+    def get_queryset(self):
+        """Join the category and user that expense listings and exports display"""
+        return super().get_queryset().select_related('category', 'user')
+
 class Expense(models.Model):
     PAYMENT_METHODS = [
         ('CASH', 'Cash'),
@@ -63,14 +74,47 @@ class Expense(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ExpenseManager()
+    
     class Meta:
         ordering = ['-date']
+        indexes = [
+            models.Index(fields=['user', 'date']),
+            models.Index(fields=['user', 'category', 'date']),
+        ]
     
     def __str__(self):
         return f"{self.description} - ${self.amount}"
     
     def get_absolute_url(self):
         return reverse('tracker:expense_list')
+    
+    def delete(self, *args, **kwargs):
+        # Deletes are not signalled for Expense (see clear_expense_caches), so clear the caches here
+        result = super().delete(*args, **kwargs)
+        clear_expense_caches(self.user_id)
+        return result
+
+class IncomeQuerySet(models.QuerySet):
+    def due(self, current_date=None):
+        """Recurring incomes that should be processed for the given date, decided in SQL"""
+        if current_date is None:
+            current_date = timezone.now().date()
+        
+        # Rows never processed count from their own date, the rest from their last run
+        return self.filter(is_recurring=True).filter(
+            (Q(last_processed_date__isnull=True) & self._recurrence_rules('date__date', current_date)) |
+            (Q(last_processed_date__isnull=False) & self._recurrence_rules('last_processed_date', current_date))
+        )
+    
+    @staticmethod
+    def _recurrence_rules(field, current_date):
+        return (
+            Q(recurrence_pattern='DAILY', **{f'{field}__lte': current_date - timedelta(days=1)}) |
+            Q(recurrence_pattern='WEEKLY', **{f'{field}__lte': current_date - timedelta(days=7)}) |
+            (Q(recurrence_pattern='MONTHLY') & ~Q(**{f'{field}__year': current_date.year, f'{field}__month': current_date.month})) |
+            (Q(recurrence_pattern='YEARLY') & ~Q(**{f'{field}__year': current_date.year}))
+        )
 
 class Income(models.Model):
     INCOME_SOURCES = [
@@ -107,11 +151,25 @@ class Income(models.Model):
         default='NONE'
     )
     notes = models.TextField(blank=True, null=True)
+    last_processed_date = models.DateField(null=True, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = IncomeQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-date']
+        indexes = [
+            models.Index(fields=['user', 'date']),
+            models.Index(fields=['user', 'is_recurring', 'recurrence_pattern']),
+            # The recurring sweep runs across all users, so it needs an index without user in front;
+            # due() compares last_processed_date, or date when it is NULL, within each pattern
+            models.Index(
+                fields=['recurrence_pattern', 'last_processed_date', 'date'],
+                condition=Q(is_recurring=True),
+                name='income_recurring_idx'
+            ),
+        ]
     
     def __str__(self):
         return f"{self.get_source_display()} - ${self.amount}"
@@ -120,14 +178,14 @@ class Income(models.Model):
         return reverse('tracker:income_list')
     
     def should_process_recurrence(self, current_date=None):
-        """Check if this recurring income should be processed for the given date"""
+        """Check if this recurring income should be processed for the given date (same rules as Income.objects.due)"""
         if not self.is_recurring or self.recurrence_pattern == 'NONE':
             return False
             
         if current_date is None:
             current_date = timezone.now().date()
             
-        last_occurrence = self.date.date()
+        last_occurrence = self.last_processed_date or self.date.date()
         
         if self.recurrence_pattern == 'DAILY':
             return (current_date - last_occurrence).days >= 1
@@ -141,6 +199,22 @@ class Income(models.Model):
             
         return False
 
+class BudgetQuerySet(models.QuerySet):
+    def with_spent(self):
+        """Annotate each budget with its spending so spent_amount() needs no query"""
+        # Local dates are compared like spent_amount() does. The raw-column range around them is a day
+        # wider on each side, which covers any UTC offset, so the (user, category, date) index applies
+        end_date = Coalesce(OuterRef('end_date'), Value(timezone.now().date()))
+        spent_subquery = Expense.objects.filter(
+            user=OuterRef('user'),
+            category=OuterRef('category'),
+            date__gte=Cast(OuterRef('start_date'), models.DateTimeField()) - Value(timedelta(days=1)),
+            date__lt=Cast(end_date, models.DateTimeField()) + Value(timedelta(days=2)),
+            date__date__gte=OuterRef('start_date'),
+            date__date__lte=end_date
+        ).values('category').annotate(total=Sum('amount')).values('total')
+        return self.annotate(spent=Coalesce(Subquery(spent_subquery), Value(Decimal('0'))))
+
 class Budget(models.Model):
     PERIOD_CHOICES = [
         ('DAILY', 'Daily'),
@@ -158,29 +232,44 @@ class Budget(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = BudgetQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-start_date']
         unique_together = ['user', 'category', 'period']
+        indexes = [
+            models.Index(fields=['user', 'start_date']),
+        ]
     
     def __str__(self):
         return f"{self.category} - ${self.amount} ({self.period})"
     
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # The category or dates may have changed, so drop any annotated or memoized spending
+        self.__dict__.pop('spent', None)
+    
     def spent_amount(self):
-        from django.db.models import Sum
-        result = Expense.objects.filter(
-            user=self.user,
-            category=self.category,
-            date__date__gte=self.start_date,
-            date__date__lte=self.end_date if self.end_date else timezone.now().date()
-        ).aggregate(Sum('amount'))['amount__sum']
-        return result or 0
+        # Use the with_spent() annotation when present, otherwise query once per instance
+        if not hasattr(self, 'spent'):
+            # Half-open aware datetime range so the (user, category, date) index applies
+            tz = timezone.get_current_timezone()
+            end_date = self.end_date if self.end_date else timezone.now().date()
+            result = Expense.objects.filter(
+                user_id=self.user_id,
+                category_id=self.category_id,
+                date__gte=datetime.combine(self.start_date, time.min, tzinfo=tz),
+                date__lt=datetime.combine(end_date + timedelta(days=1), time.min, tzinfo=tz)
+            ).aggregate(Sum('amount'))['amount__sum']
+            self.spent = result or 0
+        return self.spent
     
     def remaining_amount(self):
         return self.amount - self.spent_amount()
     
     def progress_percentage(self):
         if self.amount > 0:
-            return min((self.spent_amount() / self.amount) * 100, 100)
+            return min(self.spent_amount() * 100 / self.amount, 100)
         return 0
     
     def is_over_budget(self):
@@ -189,9 +278,11 @@ class Budget(models.Model):
     
     def get_budget_status(self):
         """Get budget status for alerts"""
-        spent = self.spent_amount()
-        percentage = self.progress_percentage()
-        
+        return self.status_for_percentage(self.progress_percentage())
+    
+    @staticmethod
+    def status_for_percentage(percentage):
+        """Map a progress percentage to a budget status"""
         if percentage >= 100:
             return 'exceeded'
         elif percentage >= 80:
@@ -201,6 +292,44 @@ class Budget(models.Model):
         else:
             return 'good'
 
+class FinancialGoalQuerySet(models.QuerySet):
+    def active(self):
+        """Goals whose current amount hasn't reached the target yet"""
+        return self.filter(current_amount__lt=F('target_amount'))
+    
+    def with_progress(self):
+        """Annotate each goal's progress percentage so list pages don't recompute it per call"""
+        percentage = models.DecimalField(max_digits=12, decimal_places=2)
+        return self.annotate(progress=Case(
+            # 100.0 keeps the division fractional on backends that store whole amounts as integers
+            When(target_amount__gt=0, then=ExpressionWrapper(
+                F('current_amount') * 100.0 / F('target_amount'), output_field=percentage
+            )),
+            default=Value(Decimal('0')),
+            output_field=percentage
+        ))
+    
+    def with_status(self, today=None):
+        """Annotate progress, completion, amount needed and the get_goal_status() label in the same query"""
+        if today is None:
+            today = date.today()
+        
+        # days_remaining() <= N is the same test as deadline <= today + N, even for past deadlines
+        return self.with_progress().annotate(
+            completed=ExpressionWrapper(Q(current_amount__gte=F('target_amount')), output_field=models.BooleanField()),
+            needed=Greatest(
+                F('target_amount') - F('current_amount'), Value(Decimal('0')),
+                output_field=models.DecimalField(max_digits=12, decimal_places=2)
+            ),
+            status=Case(
+                When(current_amount__gte=F('target_amount'), then=Value('completed')),
+                When(deadline__lte=today + timedelta(days=7), then=Value('urgent')),
+                When(deadline__lte=today + timedelta(days=30), then=Value('warning')),
+                default=Value('active'),
+                output_field=models.CharField()
+            )
+        )
+
 class FinancialGoal(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     name = models.CharField(max_length=200)
@@ -211,15 +340,26 @@ class FinancialGoal(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = FinancialGoalQuerySet.as_manager()
+    
     class Meta:
         ordering = ['deadline']
     
     def __str__(self):
         return self.name
     
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # The amounts or deadline may have changed, so drop any with_progress()/with_status() annotations
+        for annotation in ('progress', 'completed', 'needed', 'status'):
+            self.__dict__.pop(annotation, None)
+    
     def progress_percentage(self):
+        # Use the with_progress() annotation when present
+        if hasattr(self, 'progress'):
+            return self.progress
         if self.target_amount > 0:
-            return (self.current_amount / self.target_amount) * 100
+            return self.current_amount * 100 / self.target_amount
         return 0
     
     def days_remaining(self):
@@ -228,14 +368,20 @@ class FinancialGoal(models.Model):
     
     def is_completed(self):
         """Check if goal is completed"""
+        if hasattr(self, 'completed'):
+            return self.completed
         return self.current_amount >= self.target_amount
     
     def amount_needed(self):
         """Calculate amount needed to reach goal"""
+        if hasattr(self, 'needed'):
+            return self.needed
         return max(self.target_amount - self.current_amount, 0)
     
     def get_goal_status(self):
         """Get goal status for display"""
+        if hasattr(self, 'status'):
+            return self.status
         if self.is_completed():
             return 'completed'
         elif self.days_remaining() <= 7:
@@ -267,7 +413,7 @@ class FinancialReport(models.Model):
     start_date = models.DateField()
     end_date = models.DateField()
     file_path = models.CharField(max_length=500, blank=True, null=True)
-    generated_at = models.DateTimeField(auto_now_add=True)
+    generated_at = models.DateTimeField(auto_now_add=True, db_index=True)
     
     class Meta:
         ordering = ['-generated_at']
@@ -302,14 +448,18 @@ class Notification(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'is_read', '-created_at']),
+            models.Index(fields=['user', '-created_at']),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.user.username}"
     
     def mark_as_read(self):
         """Mark notification as read"""
+        type(self).objects.filter(pk=self.pk).update(is_read=True)
         self.is_read = True
-        self.save()
 
 class UserProfile(models.Model):
     """Extended user profile for additional settings"""
@@ -322,6 +472,15 @@ class UserProfile(models.Model):
         ('JPY', 'Japanese Yen (¥)'),
     ]
     
+    CURRENCY_SYMBOLS = {
+        'USD': '$',
+        'EUR': '€',
+        'GBP': '£',
+        'ETB': 'Br',
+        'INR': '₹',
+        'JPY': '¥',
+    }
+    
     THEME_CHOICES = [
         ('LIGHT', 'Light Theme'),
         ('DARK', 'Dark Theme'),
@@ -344,26 +503,117 @@ class UserProfile(models.Model):
     
     def get_currency_symbol(self):
         """Get currency symbol for display"""
-        currency_symbols = {
-            'USD': '$',
-            'EUR': '€',
-            'GBP': '£',
-            'ETB': 'Br',
-            'INR': '₹',
-            'JPY': '¥',
-        }
-        return currency_symbols.get(self.currency, '$')
+        return self.CURRENCY_SYMBOLS.get(self.currency, '$')
 
 # Signal to create user profile when user is created
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+from django.core.cache import cache
+import uuid
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
         UserProfile.objects.create(user=instance)
 
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    if hasattr(instance, 'profile'):
-        instance.profile.save()
\ No newline at end of file
+# Dashboard stats cache, invalidated whenever the underlying figures change
+DASHBOARD_STATS_CACHE_TIMEOUT = 300
+
+def dashboard_stats_cache_key(user_id):
+    return f'dashboard_stats:{user_id}'
+
+@receiver(post_save, sender=Budget)
+@receiver(post_delete, sender=Budget)
+@receiver(post_save, sender=FinancialGoal)
+@receiver(post_delete, sender=FinancialGoal)
+def invalidate_dashboard_stats(sender, instance, **kwargs):
+    cache.delete(dashboard_stats_cache_key(instance.user_id))
+
+# Per-user category caches: the API list and the form select choices
+CATEGORY_LIST_CACHE_TIMEOUT = 3600
+CATEGORY_CHOICES_CACHE_TIMEOUT = 300
+
+def category_list_cache_key(user_id):
+    return f'categories:{user_id}'
+
+def category_choices_cache_key(user_id, category_type=None, limit=None):
+    key = f'category_choices:{user_id}:{category_type or "all"}'
+    return f'{key}:top{limit}' if limit else key
+
+def clear_category_caches(user_id):
+    cache.delete_many([
+        category_list_cache_key(user_id),
+        category_choices_cache_key(user_id),
+        category_choices_cache_key(user_id, 'expense'),
+        category_choices_cache_key(user_id, 'income'),
+        category_choices_cache_key(user_id, 'expense', limit=5),  # QuickExpenseForm shortlist
+    ])
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_caches(sender, instance, **kwargs):
+    clear_category_caches(instance.user_id)
+
+# Remembers that a user already has categories, so forms skip the lookup
+DEFAULT_CATEGORIES_CACHE_TIMEOUT = 60 * 60 * 24
+
+def default_categories_cache_key(user_id):
+    return f'default_categories:{user_id}'
+
+@receiver(post_delete, sender=Category)
+def invalidate_default_categories(sender, instance, **kwargs):
+    cache.delete(default_categories_cache_key(instance.user_id))
+
+# Dashboard chart payloads, cached per user for the current month
+EXPENSE_CHART_CACHE_TIMEOUT = 3600
+
+def expense_chart_cache_key(user_id, chart, month=None):
+    month = month or timezone.now().strftime('%Y-%m')
+    return f'expense_chart:{chart}:{user_id}:{month}'
+
+# Version token in the cached expense list counts; deleting it moves every count key for the user
+def expense_list_version_key(user_id):
+    return f'expense_list_version:{user_id}'
+
+def expense_list_version(user_id):
+    return cache.get_or_set(expense_list_version_key(user_id), lambda: uuid.uuid4().hex, None)
+
+def clear_expense_caches(user_id):
+    cache.delete_many([
+        expense_list_version_key(user_id),
+        dashboard_stats_cache_key(user_id),
+        expense_chart_cache_key(user_id, 'trend'),
+        expense_chart_cache_key(user_id, 'category'),
+        expense_chart_cache_key(user_id, 'budget'),
+        expense_chart_cache_key(user_id, 'totals'),
+        expense_chart_cache_key(user_id, 'summary'),
+    ])
+
+# Expense has no delete receivers: any pre/post_delete listener turns off the fast delete of the
+# expenses cascaded from a Category or User. Expense.delete() clears direct deletes, and the
+# Category receiver clears a whole cascade once. Category edits also change chart labels and
+# colors, and which expenses count as spending.
+@receiver(post_save, sender=Expense)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_expense_caches(sender, instance, **kwargs):
+    clear_expense_caches(instance.user_id)
+
+def clear_monthly_totals(user_id):
+    cache.delete_many([
+        expense_chart_cache_key(user_id, 'totals'),
+        expense_chart_cache_key(user_id, 'summary'),
+    ])
+
+@receiver(post_save, sender=Income)
+@receiver(post_delete, sender=Income)
+def invalidate_monthly_totals(sender, instance, **kwargs):
+    clear_monthly_totals(instance.user_id)
+
+@receiver(post_save, sender=Budget)
+@receiver(post_delete, sender=Budget)
+def invalidate_budget_chart(sender, instance, **kwargs):
+    cache.delete_many([
+        expense_chart_cache_key(instance.user_id, 'budget'),
+        expense_chart_cache_key(instance.user_id, 'summary'),
+    ])
@@ -0,0 +1,97 @@
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+from .models import expense_list_version
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that stores the total row count in the cache"""
+
+    def __init__(self, *args, cache_key=None, refresh=False, timeout=300, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_key = cache_key
+        self.refresh = refresh
+        self.timeout = timeout
+
+    @cached_property
+    def count(self):
+        if self.cache_key is None:
+            return super().count
+
+        if not self.refresh:
+            cached_count = cache.get(self.cache_key)
+            if cached_count is not None:
+                return cached_count
+
+        total = super().count
+        cache.set(self.cache_key, total, self.timeout)
+        return total
+
+
+class PkPaginator(Paginator):
+    """Paginator that applies OFFSET to a primary key query, then fetches just the page's rows"""
+    
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        
+        # The offset scan only reads the ordering columns and ids; joins run for this page alone
+        ids = list(self.object_list.values_list('pk', flat=True)[bottom:top])
+        rows = self.object_list.order_by().in_bulk(ids)
+        return self._get_page([rows[pk] for pk in ids if pk in rows], number, self)
+
+
+class CachedCountPagination(PageNumberPagination):
+    """Page number pagination that only runs COUNT(*) on the first page"""
+    count_cache_timeout = 300
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        return super().paginate_queryset(queryset, request, view)
+
+    def django_paginator_class(self, object_list, per_page):
+        return CachedCountPaginator(
+            object_list,
+            per_page,
+            cache_key=self.get_count_cache_key(self.request),
+            refresh=self.request.query_params.get(self.page_query_param, '1') == '1',
+            timeout=self.count_cache_timeout
+        )
+
+    def get_count_cache_key(self, request):
+        params = {
+            key: value for key, value in request.query_params.lists()
+            if key != self.page_query_param
+        }
+        if isinstance(request.data, dict):
+            params.update(request.data)
+
+        digest = hashlib.md5(
+            json.dumps(params, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        version = self.get_count_cache_version(request)
+        return f'page_count:{request.user.id}:{version}:{request.path}:{digest}'
+    
+    def get_count_cache_version(self, request):
+        """Token that changes whenever the counted rows do, so writes retire the cached counts"""
+        return ''
+
+
+class ExpenseCountPagination(CachedCountPagination):
+    """Cached count pagination whose counts are dropped by clear_expense_caches() on expense writes"""
+    
+    def get_count_cache_version(self, request):
+        return expense_list_version(request.user.id)
+
+
+class DateCursorPagination(CursorPagination):
+    """Keyset pagination on date, so deep pages cost the same as the first one"""
+    ordering = ('-date', '-id')
@@ -0,0 +1,43 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# orjson is optional; without it the renderer behaves like DRF's JSONRenderer
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON renderer that encodes with orjson when it is installed"""
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # orjson can't do arbitrary indents, so pretty-printed output keeps the stdlib path
+        if not ORJSON_AVAILABLE or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b''
+
+        # Decimals, datetimes, lazy strings etc. go through DRF's encoder so output matches
+        return orjson.dumps(
+            data,
+            default=self.encoder.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        )
+
+
+def json_response(data):
+    """JsonResponse replacement for plain Django views, encoded with orjson when it is installed"""
+    if not ORJSON_AVAILABLE:
+        return JsonResponse(data, safe=False)
+    
+    # DjangoJSONEncoder handles Decimals and dates the same way JsonResponse would
+    return HttpResponse(
+        orjson.dumps(data, default=DjangoJSONEncoder().default),
+        content_type='application/json'
+    )
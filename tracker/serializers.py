@@ -1,12 +1,62 @@
+import decimal
+from datetime import date
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db import models
 from .models import Category, Expense, Budget, FinancialGoal, Income, UserProfile, FinancialReport, Notification
 
+# Columns of joined rows that the nested *_name / *_color / user_username fields never read
+UNUSED_CATEGORY_COLUMNS = ('category__type', 'category__icon', 'category__user', 'category__created_at', 'category__updated_at')
+UNUSED_USER_COLUMNS = (
+    'user__password', 'user__last_login', 'user__is_superuser', 'user__first_name', 'user__last_name',
+    'user__email', 'user__is_staff', 'user__is_active', 'user__date_joined'
+)
+
+class FastDecimalField(serializers.DecimalField):
+    """DecimalField that builds its quantize exponent and context once instead of per value"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.decimal_places is not None:
+            self.quantum = decimal.Decimal(1).scaleb(-self.decimal_places)
+            self.quantize_context = decimal.Context(prec=self.max_digits) if self.max_digits is not None else None
+    
+    def quantize(self, value):
+        if self.decimal_places is None:
+            return value
+        return value.quantize(self.quantum, rounding=self.rounding, context=self.quantize_context)
+
+MONEY_STEP = decimal.Decimal('0.01')
+
+class PositiveMoneyField(FastDecimalField):
+    """Money amount of at least one cent, checked by the field's own min_value validator"""
+    def __init__(self, message="Amount must be greater than zero.", **kwargs):
+        kwargs.setdefault('max_digits', 12)
+        kwargs.setdefault('decimal_places', 2)
+        kwargs.setdefault('min_value', MONEY_STEP)
+        kwargs.setdefault('error_messages', {'min_value': message})
+        super().__init__(**kwargs)
+
+class ChoiceDisplayField(serializers.ReadOnlyField):
+    """Read-only label for a choices field, looked up in a dict built once instead of per row"""
+    def __init__(self, choices, **kwargs):
+        self.labels = dict(choices)
+        super().__init__(**kwargs)
+    
+    def to_representation(self, value):
+        return self.labels.get(value, value)
+
+class DecimalModelSerializer(serializers.ModelSerializer):
+    """ModelSerializer that maps model DecimalFields to FastDecimalField"""
+    serializer_field_mapping = {
+        **serializers.ModelSerializer.serializer_field_mapping,
+        models.DecimalField: FastDecimalField,
+    }
+
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ['id', 'username', 'email', 'first_name', 'last_name', 'date_joined']
-        read_only_fields = ['date_joined']
+        fields = ('id', 'username', 'email', 'first_name', 'last_name', 'date_joined')
+        read_only_fields = ('date_joined',)
 
 class UserProfileSerializer(serializers.ModelSerializer):
     user_username = serializers.CharField(source='user.username', read_only=True)
@@ -15,64 +65,84 @@ class UserProfileSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = UserProfile
-        fields = [
+        fields = (
             'id', 'user', 'user_username', 'user_email', 'currency', 'currency_symbol',
             'theme', 'language', 'timezone', 'receive_email_notifications',
             'receive_budget_alerts', 'monthly_report_enabled', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
+        )
+        read_only_fields = ('created_at', 'updated_at')
 
 class CategorySerializer(serializers.ModelSerializer):
-    type_display = serializers.CharField(source='get_type_display', read_only=True)
-    name_display = serializers.CharField(source='get_name_display', read_only=True)
+    type_display = ChoiceDisplayField(Category.CATEGORY_TYPES, source='type')
+    name_display = ChoiceDisplayField(Category.CATEGORY_CHOICES, source='name')
     
     class Meta:
         model = Category
-        fields = ['id', 'name', 'name_display', 'type', 'type_display', 'color', 'icon', 'user', 'created_at', 'updated_at']
-        read_only_fields = ['created_at', 'updated_at']
+        fields = ('id', 'name', 'name_display', 'type', 'type_display', 'color', 'icon', 'user', 'created_at', 'updated_at')
+        read_only_fields = ('created_at', 'updated_at')
 
-class ExpenseSerializer(serializers.ModelSerializer):
+class ExpenseSerializer(DecimalModelSerializer):
+    amount = PositiveMoneyField()
     category_name = serializers.CharField(source='category.name', read_only=True)
     category_color = serializers.CharField(source='category.color', read_only=True)
-    payment_method_display = serializers.CharField(source='get_payment_method_display', read_only=True)
+    payment_method_display = ChoiceDisplayField(Expense.PAYMENT_METHODS, source='payment_method')
     user_username = serializers.CharField(source='user.username', read_only=True)
     
     class Meta:
         model = Expense
-        fields = [
+        fields = (
             'id', 'amount', 'description', 'category', 'category_name', 'category_color',
             'date', 'payment_method', 'payment_method_display', 'notes', 'user', 'user_username',
             'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
+        )
+        read_only_fields = ('created_at', 'updated_at')
     
-    def validate_amount(self, value):
-        if value <= 0:
-            raise serializers.ValidationError("Amount must be greater than zero.")
-        return value
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the related rows this serializer reads; only the category's name and color are used"""
+        return queryset.select_related('category', 'user').defer(*UNUSED_CATEGORY_COLUMNS, *UNUSED_USER_COLUMNS)
     
     def create(self, validated_data):
         validated_data['user'] = self.context['request'].user
         return super().create(validated_data)
 
-class IncomeSerializer(serializers.ModelSerializer):
-    source_display = serializers.CharField(source='get_source_display', read_only=True)
-    recurrence_pattern_display = serializers.CharField(source='get_recurrence_pattern_display', read_only=True)
+class ExpenseListSerializer(serializers.Serializer):
+    """Read-only ExpenseSerializer counterpart that works on .values() rows"""
+    value_fields = (
+        'id', 'amount', 'description', 'category_id', 'category__name', 'category__color',
+        'date', 'payment_method', 'notes', 'user_id', 'user__username',
+        'created_at', 'updated_at'
+    )
+    
+    id = serializers.IntegerField()
+    amount = FastDecimalField(max_digits=12, decimal_places=2)
+    description = serializers.CharField()
+    category = serializers.IntegerField(source='category_id')
+    category_name = serializers.CharField(source='category__name')
+    category_color = serializers.CharField(source='category__color')
+    date = serializers.DateTimeField()
+    payment_method = serializers.CharField()
+    payment_method_display = ChoiceDisplayField(Expense.PAYMENT_METHODS, source='payment_method')
+    notes = serializers.CharField(allow_null=True)
+    user = serializers.IntegerField(source='user_id')
+    user_username = serializers.CharField(source='user__username')
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+
+class IncomeSerializer(DecimalModelSerializer):
+    amount = PositiveMoneyField()
+    source_display = ChoiceDisplayField(Income.INCOME_SOURCES, source='source')
+    recurrence_pattern_display = ChoiceDisplayField(Income.RECURRENCE_PATTERNS, source='recurrence_pattern')
     user_username = serializers.CharField(source='user.username', read_only=True)
     
     class Meta:
         model = Income
-        fields = [
+        fields = (
             'id', 'amount', 'source', 'source_display', 'description', 'date',
             'is_recurring', 'recurrence_pattern', 'recurrence_pattern_display',
             'notes', 'user', 'user_username', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
-    
-    def validate_amount(self, value):
-        if value <= 0:
-            raise serializers.ValidationError("Amount must be greater than zero.")
-        return value
+        )
+        read_only_fields = ('created_at', 'updated_at')
     
     def validate(self, data):
         is_recurring = data.get('is_recurring')
@@ -87,30 +157,31 @@ class IncomeSerializer(serializers.ModelSerializer):
         validated_data['user'] = self.context['request'].user
         return super().create(validated_data)
 
-class BudgetSerializer(serializers.ModelSerializer):
+class BudgetSerializer(DecimalModelSerializer):
+    amount = PositiveMoneyField(message="Budget amount must be greater than zero.")
     category_name = serializers.CharField(source='category.name', read_only=True)
     category_color = serializers.CharField(source='category.color', read_only=True)
-    period_display = serializers.CharField(source='get_period_display', read_only=True)
+    period_display = ChoiceDisplayField(Budget.PERIOD_CHOICES, source='period')
     user_username = serializers.CharField(source='user.username', read_only=True)
-    spent_amount = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
-    remaining_amount = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
-    progress_percentage = serializers.FloatField(read_only=True)
+    spent_amount = FastDecimalField(max_digits=12, decimal_places=2, read_only=True)
+    remaining_amount = FastDecimalField(max_digits=12, decimal_places=2, read_only=True)
+    progress_percentage = FastDecimalField(max_digits=None, decimal_places=2, coerce_to_string=False, read_only=True)
     is_over_budget = serializers.BooleanField(read_only=True)
     budget_status = serializers.CharField(source='get_budget_status', read_only=True)
     
     class Meta:
         model = Budget
-        fields = [
+        fields = (
             'id', 'category', 'category_name', 'category_color', 'amount', 'period', 'period_display',
             'start_date', 'end_date', 'user', 'user_username', 'spent_amount', 'remaining_amount',
             'progress_percentage', 'is_over_budget', 'budget_status', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
+        )
+        read_only_fields = ('created_at', 'updated_at')
     
-    def validate_amount(self, value):
-        if value <= 0:
-            raise serializers.ValidationError("Budget amount must be greater than zero.")
-        return value
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the related rows this serializer reads; only the category's name and color are used"""
+        return queryset.select_related('category', 'user').defer(*UNUSED_CATEGORY_COLUMNS, *UNUSED_USER_COLUMNS)
     
     def validate(self, data):
         start_date = data.get('start_date')
@@ -125,27 +196,28 @@ class BudgetSerializer(serializers.ModelSerializer):
         validated_data['user'] = self.context['request'].user
         return super().create(validated_data)
 
-class FinancialGoalSerializer(serializers.ModelSerializer):
+class FinancialGoalSerializer(DecimalModelSerializer):
+    target_amount = PositiveMoneyField(message="Target amount must be greater than zero.")
     user_username = serializers.CharField(source='user.username', read_only=True)
-    progress_percentage = serializers.FloatField(read_only=True)
+    progress_percentage = FastDecimalField(max_digits=None, decimal_places=2, coerce_to_string=False, read_only=True)
     days_remaining = serializers.IntegerField(read_only=True)
     is_completed = serializers.BooleanField(read_only=True)
-    amount_needed = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+    amount_needed = FastDecimalField(max_digits=12, decimal_places=2, read_only=True)
     goal_status = serializers.CharField(source='get_goal_status', read_only=True)
     
     class Meta:
         model = FinancialGoal
-        fields = [
+        fields = (
             'id', 'name', 'target_amount', 'current_amount', 'deadline', 'description',
             'user', 'user_username', 'progress_percentage', 'days_remaining',
             'is_completed', 'amount_needed', 'goal_status', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
+        )
+        read_only_fields = ('created_at', 'updated_at')
     
-    def validate_target_amount(self, value):
-        if value <= 0:
-            raise serializers.ValidationError("Target amount must be greater than zero.")
-        return value
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the related rows this serializer reads"""
+        return queryset.select_related('user').defer(*UNUSED_USER_COLUMNS)
     
     def validate_current_amount(self, value):
         target_amount = self.initial_data.get('target_amount')
@@ -160,8 +232,9 @@ class FinancialGoalSerializer(serializers.ModelSerializer):
         return value
     
     def validate_deadline(self, value):
-        from datetime import date
-        if value < date.today():
+        # Batch callers can pass context={'today': ...} so many=True validation reads the clock once
+        today = self.context.get('today') or date.today()
+        if value < today:
             raise serializers.ValidationError("Deadline cannot be in the past.")
         return value
     
@@ -170,83 +243,83 @@ class FinancialGoalSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 class FinancialReportSerializer(serializers.ModelSerializer):
-    report_type_display = serializers.CharField(source='get_report_type_display', read_only=True)
-    report_format_display = serializers.CharField(source='get_report_format_display', read_only=True)
+    report_type_display = ChoiceDisplayField(FinancialReport.REPORT_TYPES, source='report_type')
+    report_format_display = ChoiceDisplayField(FinancialReport.REPORT_FORMATS, source='report_format')
     user_username = serializers.CharField(source='user.username', read_only=True)
     is_downloadable = serializers.BooleanField(read_only=True)
     
     class Meta:
         model = FinancialReport
-        fields = [
+        fields = (
             'id', 'user', 'user_username', 'report_type', 'report_type_display',
             'report_format', 'report_format_display', 'title', 'description',
             'start_date', 'end_date', 'file_path', 'is_downloadable', 'generated_at'
-        ]
-        read_only_fields = ['generated_at']
+        )
+        read_only_fields = ('generated_at',)
 
 class NotificationSerializer(serializers.ModelSerializer):
-    notification_type_display = serializers.CharField(source='get_notification_type_display', read_only=True)
+    notification_type_display = ChoiceDisplayField(Notification.NOTIFICATION_TYPES, source='notification_type')
     user_username = serializers.CharField(source='user.username', read_only=True)
     
     class Meta:
         model = Notification
-        fields = [
+        fields = (
             'id', 'user', 'user_username', 'notification_type', 'notification_type_display',
             'title', 'message', 'is_read', 'related_object_id', 'related_content_type',
             'created_at'
-        ]
-        read_only_fields = ['created_at']
+        )
+        read_only_fields = ('created_at',)
 
 # Summary and Analytics Serializers
 class ExpenseSummarySerializer(serializers.Serializer):
-    total_expenses = serializers.DecimalField(max_digits=12, decimal_places=2)
-    total_income = serializers.DecimalField(max_digits=12, decimal_places=2)
-    net_savings = serializers.DecimalField(max_digits=12, decimal_places=2)
+    total_expenses = serializers.FloatField()
+    total_income = serializers.FloatField()
+    net_savings = serializers.FloatField()
     expense_count = serializers.IntegerField()
     income_count = serializers.IntegerField()
     savings_rate = serializers.FloatField()
 
 class IncomeSummarySerializer(serializers.Serializer):
-    total_income = serializers.DecimalField(max_digits=12, decimal_places=2)
-    recurring_income = serializers.DecimalField(max_digits=12, decimal_places=2)
-    income_by_source = serializers.DictField(child=serializers.DecimalField(max_digits=12, decimal_places=2))
+    total_income = FastDecimalField(max_digits=12, decimal_places=2)
+    recurring_income = FastDecimalField(max_digits=12, decimal_places=2)
+    income_by_source = serializers.DictField(child=FastDecimalField(max_digits=12, decimal_places=2))
     income_count = serializers.IntegerField()
 
 class CategorySummarySerializer(serializers.Serializer):
     category_name = serializers.CharField()
     category_color = serializers.CharField()
-    total_amount = serializers.DecimalField(max_digits=12, decimal_places=2)
+    total_amount = FastDecimalField(max_digits=12, decimal_places=2)
     percentage = serializers.FloatField()
     transaction_count = serializers.IntegerField()
 
 class MonthlyTrendSerializer(serializers.Serializer):
     month = serializers.CharField()
-    expenses = serializers.DecimalField(max_digits=12, decimal_places=2)
-    income = serializers.DecimalField(max_digits=12, decimal_places=2)
-    savings = serializers.DecimalField(max_digits=12, decimal_places=2)
+    expenses = serializers.FloatField()
+    income = serializers.FloatField()
+    savings = serializers.FloatField()
 
 class BudgetProgressSerializer(serializers.Serializer):
     category_name = serializers.CharField()
-    budget_amount = serializers.DecimalField(max_digits=12, decimal_places=2)
-    spent_amount = serializers.DecimalField(max_digits=12, decimal_places=2)
-    remaining_amount = serializers.DecimalField(max_digits=12, decimal_places=2)
-    progress_percentage = serializers.FloatField()
+    budget_amount = FastDecimalField(max_digits=12, decimal_places=2)
+    spent_amount = FastDecimalField(max_digits=12, decimal_places=2)
+    remaining_amount = FastDecimalField(max_digits=12, decimal_places=2)
+    progress_percentage = FastDecimalField(max_digits=5, decimal_places=2, coerce_to_string=False)
     is_over_budget = serializers.BooleanField()
     budget_status = serializers.CharField()
 
 class GoalProgressSerializer(serializers.Serializer):
     goal_name = serializers.CharField()
-    target_amount = serializers.DecimalField(max_digits=12, decimal_places=2)
-    current_amount = serializers.DecimalField(max_digits=12, decimal_places=2)
+    target_amount = FastDecimalField(max_digits=12, decimal_places=2)
+    current_amount = FastDecimalField(max_digits=12, decimal_places=2)
     progress_percentage = serializers.FloatField()
     days_remaining = serializers.IntegerField()
     is_completed = serializers.BooleanField()
     goal_status = serializers.CharField()
 
 class DashboardSummarySerializer(serializers.Serializer):
-    monthly_income = serializers.DecimalField(max_digits=12, decimal_places=2)
-    monthly_expenses = serializers.DecimalField(max_digits=12, decimal_places=2)
-    monthly_savings = serializers.DecimalField(max_digits=12, decimal_places=2)
+    monthly_income = serializers.FloatField()
+    monthly_expenses = serializers.FloatField()
+    monthly_savings = serializers.FloatField()
     savings_rate = serializers.FloatField()
     budget_alerts_count = serializers.IntegerField()
     active_goals_count = serializers.IntegerField()
@@ -258,16 +331,16 @@ class ExpenseFilterSerializer(serializers.Serializer):
     start_date = serializers.DateField(required=False)
     end_date = serializers.DateField(required=False)
     payment_method = serializers.CharField(required=False)
-    min_amount = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
-    max_amount = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    min_amount = FastDecimalField(max_digits=12, decimal_places=2, required=False)
+    max_amount = FastDecimalField(max_digits=12, decimal_places=2, required=False)
 
 class IncomeFilterSerializer(serializers.Serializer):
     source = serializers.CharField(required=False)
     start_date = serializers.DateField(required=False)
     end_date = serializers.DateField(required=False)
     is_recurring = serializers.BooleanField(required=False)
-    min_amount = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
-    max_amount = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    min_amount = FastDecimalField(max_digits=12, decimal_places=2, required=False)
+    max_amount = FastDecimalField(max_digits=12, decimal_places=2, required=False)
 
 class BudgetFilterSerializer(serializers.Serializer):
     category = serializers.IntegerField(required=False)
@@ -1,3 +1,584 @@
+import csv
+import json
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .models import (
+    Budget, Category, Expense, FinancialGoal, Income,
+    category_list_cache_key, category_choices_cache_key, dashboard_stats_cache_key, expense_chart_cache_key
+)
+from .pagination import PkPaginator
+from .utils import month_start
+
+
+class IncomeDueTests(TestCase):
+    """Income.objects.due() recurrence rules, checked against should_process_recurrence()"""
+    today = date(2026, 3, 15)
+    
+    def setUp(self):
+        self.user = User.objects.create_user('alice', password='pw')
+    
+    def make_income(self, pattern, on, **kwargs):
+        return Income.objects.create(
+            user=self.user,
+            amount=Decimal('100.00'),
+            description=f'{pattern} {on}',
+            date=datetime(on.year, on.month, on.day, 12, tzinfo=dt_timezone.utc),
+            is_recurring=True,
+            recurrence_pattern=pattern,
+            **kwargs
+        )
+    
+    def assertDue(self, income, expected):
+        self.assertEqual(Income.objects.due(self.today).filter(pk=income.pk).exists(), expected)
+        self.assertEqual(income.should_process_recurrence(self.today), expected)
+    
+    def test_daily(self):
+        self.assertDue(self.make_income('DAILY', date(2026, 3, 14)), True)
+        self.assertDue(self.make_income('DAILY', date(2026, 3, 15)), False)
+    
+    def test_weekly(self):
+        self.assertDue(self.make_income('WEEKLY', date(2026, 3, 8)), True)
+        self.assertDue(self.make_income('WEEKLY', date(2026, 3, 9)), False)
+    
+    def test_monthly(self):
+        self.assertDue(self.make_income('MONTHLY', date(2026, 2, 28)), True)
+        self.assertDue(self.make_income('MONTHLY', date(2026, 3, 1)), False)
+    
+    def test_yearly(self):
+        self.assertDue(self.make_income('YEARLY', date(2025, 12, 31)), True)
+        self.assertDue(self.make_income('YEARLY', date(2026, 1, 1)), False)
+    
+    def test_daily_after_processing(self):
+        self.assertDue(self.make_income('DAILY', date(2026, 1, 1), last_processed_date=date(2026, 3, 14)), True)
+        self.assertDue(self.make_income('DAILY', date(2026, 1, 1), last_processed_date=date(2026, 3, 15)), False)
+    
+    def test_weekly_after_processing(self):
+        self.assertDue(self.make_income('WEEKLY', date(2026, 1, 1), last_processed_date=date(2026, 3, 8)), True)
+        self.assertDue(self.make_income('WEEKLY', date(2026, 1, 1), last_processed_date=date(2026, 3, 9)), False)
+    
+    def test_monthly_after_processing(self):
+        self.assertDue(self.make_income('MONTHLY', date(2026, 1, 1), last_processed_date=date(2026, 2, 15)), True)
+        self.assertDue(self.make_income('MONTHLY', date(2026, 1, 1), last_processed_date=date(2026, 3, 2)), False)
+    
+    def test_yearly_after_processing(self):
+        self.assertDue(self.make_income('YEARLY', date(2024, 6, 1), last_processed_date=date(2025, 6, 1)), True)
+        self.assertDue(self.make_income('YEARLY', date(2024, 6, 1), last_processed_date=date(2026, 1, 1)), False)
+    
+    def test_non_recurring_is_never_due(self):
+        income = self.make_income('MONTHLY', date(2025, 1, 1))
+        Income.objects.filter(pk=income.pk).update(is_recurring=False)
+        self.assertFalse(Income.objects.due(self.today).filter(pk=income.pk).exists())
+
+
+class ProcessRecurringTransactionsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('alice', password='pw')
+        self.client.force_login(self.user)
+        self.salary = Income.objects.create(
+            user=self.user,
+            amount=Decimal('2000.00'),
+            description='Salary',
+            date=timezone.now() - timedelta(days=40),
+            is_recurring=True,
+            recurrence_pattern='MONTHLY'
+        )
+    
+    def process(self):
+        # Clear the once-a-day guard so each call runs a full sweep
+        cache.clear()
+        return self.client.post(reverse('tracker:process_recurring_transactions'))
+    
+    def test_creates_one_off_copies_and_stamps_the_original(self):
+        self.process()
+        
+        copy = Income.objects.exclude(pk=self.salary.pk).get()
+        self.assertEqual(copy.amount, Decimal('2000.00'))
+        self.assertEqual(copy.description, 'Recurring: Salary')
+        self.assertFalse(copy.is_recurring)
+        
+        self.salary.refresh_from_db()
+        self.assertEqual(self.salary.last_processed_date, timezone.now().date())
+    
+    def test_processed_rows_are_skipped_until_due_again(self):
+        self.process()
+        self.process()
+        self.assertEqual(Income.objects.count(), 2)
+
+
+class GoalUpdateProgressTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('alice', password='pw')
+        self.client.force_authenticate(self.user)
+        self.goal = FinancialGoal.objects.create(
+            user=self.user,
+            name='Car',
+            target_amount=Decimal('1000.00'),
+            current_amount=Decimal('250.00'),
+            deadline=date.today() + timedelta(days=30)
+        )
+    
+    def update_progress(self, pk, amount):
+        url = reverse('tracker:financialgoal-update-progress', args=[pk])
+        return self.client.post(url, {'current_amount': amount}, format='json')
+    
+    def test_updates_current_amount(self):
+        response = self.update_progress(self.goal.pk, '400.50')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.goal.refresh_from_db()
+        self.assertEqual(self.goal.current_amount, Decimal('400.50'))
+    
+    def test_over_target_is_rejected(self):
+        response = self.update_progress(self.goal.pk, '1000.01')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.goal.refresh_from_db()
+        self.assertEqual(self.goal.current_amount, Decimal('250.00'))
+    
+    def test_missing_goal_is_not_found(self):
+        response = self.update_progress(self.goal.pk + 1, '10')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
+    def test_other_users_goal_is_not_found(self):
+        self.client.force_authenticate(User.objects.create_user('bob', password='pw'))
+        response = self.update_progress(self.goal.pk, '10')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+
+class GoalStatusTests(TestCase):
+    """with_status() annotations must match the per-instance goal methods they replace"""
+    def setUp(self):
+        self.user = User.objects.create_user('alice', password='pw')
+    
+    def make_goal(self, current, days_left, target='1000.00'):
+        return FinancialGoal.objects.create(
+            user=self.user,
+            name=f'{current}/{target} in {days_left}d',
+            target_amount=Decimal(target),
+            current_amount=Decimal(current),
+            deadline=date.today() + timedelta(days=days_left)
+        )
+    
+    def test_annotations_match_instance_methods(self):
+        goals = [
+            self.make_goal('1000.00', 3),
+            self.make_goal('1200.00', 90),
+            self.make_goal('250.00', 3),
+            self.make_goal('250.00', -5),
+            self.make_goal('250.00', 20),
+            self.make_goal('250.00', 90),
+            self.make_goal('0.00', 90, target='0.00'),
+        ]
+        annotated = FinancialGoal.objects.with_status().in_bulk([goal.pk for goal in goals])
+        
+        for goal in goals:
+            fresh = FinancialGoal.objects.get(pk=goal.pk)
+            row = annotated[goal.pk]
+            with self.subTest(goal=goal.name):
+                self.assertEqual(row.get_goal_status(), fresh.get_goal_status())
+                self.assertEqual(row.is_completed(), fresh.is_completed())
+                self.assertEqual(row.amount_needed(), fresh.amount_needed())
+                self.assertEqual(row.progress_percentage(), fresh.progress_percentage())
+        
+        self.assertEqual(
+            [annotated[goal.pk].status for goal in goals],
+            ['completed', 'completed', 'urgent', 'urgent', 'warning', 'active', 'completed']
+        )
+    
+    def test_save_drops_stale_annotations(self):
+        goal = FinancialGoal.objects.with_status().get(pk=self.make_goal('250.00', 90).pk)
+        goal.current_amount = goal.target_amount
+        goal.save()
+        self.assertEqual(goal.get_goal_status(), 'completed')
+        self.assertEqual(goal.amount_needed(), 0)
+
+class ExpenseListTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('alice', password='pw')
+        self.client.force_authenticate(self.user)
+        self.category = Category.objects.create(user=self.user, name='FOOD', type='expense')
+        self.url = reverse('tracker:expense-list')
+    
+    def add_expenses(self, count):
+        Expense.objects.bulk_create([
+            Expense(user=self.user, category=self.category, amount=Decimal('10.00'), description=f'e{i}')
+            for i in range(count)
+        ])
+    
+    def test_etag_not_modified_until_an_edit(self):
+        self.add_expenses(3)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        expense = Expense.objects.filter(user=self.user).first()
+        expense.amount = Decimal('12.00')
+        expense.save()
+        
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+    
+    def test_cached_count_refreshes_on_first_page(self):
+        self.add_expenses(25)
+        self.assertEqual(self.client.get(self.url).data['count'], 25)
+        
+        # bulk_create sends no signals, so later pages reuse the count cached by page 1
+        self.add_expenses(5)
+        self.assertEqual(self.client.get(self.url, {'page': 2}).data['count'], 25)
+        self.assertEqual(self.client.get(self.url, {'page': 1}).data['count'], 30)
+        self.assertEqual(self.client.get(self.url, {'page': 2}).data['count'], 30)
+    
+    def test_cached_count_is_dropped_on_expense_writes(self):
+        self.assertEqual(self.client.get(self.url).data['count'], 0)
+        
+        for i in range(31):
+            Expense.objects.create(user=self.user, category=self.category, amount=Decimal('10.00'), description=f'e{i}')
+        response = self.client.get(self.url, {'page': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 31)
+        self.assertEqual(len(response.data['results']), 11)
+        
+        Expense.objects.filter(user=self.user).first().delete()
+        self.assertEqual(self.client.get(self.url, {'page': 2}).data['count'], 30)
+    
+    def streamed_json(self, response):
+        return json.loads(b''.join(response.streaming_content))
+    
+    def test_stream_returns_the_whole_list_as_one_array(self):
+        self.add_expenses(5)
+        Expense.objects.create(
+            user=User.objects.create_user('bob', password='pw'), category=self.category,
+            amount=Decimal('1.00'), description='not mine'
+        )
+        
+        response = self.client.get(self.url, {'stream': '1'})
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(self.streamed_json(response), self.client.get(self.url).json()['results'])
+    
+    def test_stream_of_an_empty_list(self):
+        response = self.client.get(self.url, {'stream': '1'})
+        self.assertEqual(self.streamed_json(response), [])
+    
+    def test_filter_streams_one_object_per_line(self):
+        self.add_expenses(3)
+        Expense.objects.create(user=self.user, category=self.category, amount=Decimal('0.50'), description='small')
+        url = reverse('tracker:expense-filter')
+        
+        response = self.client.post(f'{url}?stream=1', {'min_amount': '1'}, format='json')
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).splitlines()
+        rows = [json.loads(line) for line in lines]
+        
+        paginated = self.client.post(url, {'min_amount': '1'}, format='json').json()
+        self.assertEqual(paginated['count'], 3)
+        self.assertEqual(rows, paginated['results'])
+    
+    def test_etag_changes_when_an_expense_is_deleted(self):
+        self.add_expenses(3)
+        etag = self.client.get(self.url)['ETag']
+        
+        Expense.objects.filter(user=self.user).first().delete()
+        
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+
+
+
+class ExpenseSummaryTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('alice', password='pw')
+        self.client.force_authenticate(self.user)
+        self.food = Category.objects.create(user=self.user, name='FOOD', type='expense')
+        self.salary = Category.objects.create(user=self.user, name='INCOME', type='income')
+    
+    def add(self, category, amount, moment):
+        Expense.objects.create(user=self.user, category=category, amount=Decimal(amount), description='x', date=moment)
+    
+    def test_summary_totals_the_current_month(self):
+        now = timezone.now()
+        last_month = month_start(now) - timedelta(days=1)
+        self.add(self.food, '30.00', now)
+        self.add(self.food, '20.00', now)
+        self.add(self.food, '40.00', last_month)
+        self.add(self.salary, '100.00', now)
+        Expense.objects.create(
+            user=User.objects.create_user('bob', password='pw'),
+            category=self.food, amount=Decimal('999.00'), description='x'
+        )
+        
+        response = self.client.get(reverse('tracker:expense-summary'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {
+            'total_expenses': 50.0,
+            'total_income': 100.0,
+            'net_savings': 50.0,
+            'expense_count': 3,
+            'income_count': 1,
+            'savings_rate': 50.0,
+        })
+    
+    def test_summary_without_income(self):
+        self.add(self.food, '30.00', timezone.now())
+        response = self.client.get(reverse('tracker:expense-summary'))
+        self.assertEqual(response.data['savings_rate'], 0)
+        self.assertEqual(response.data['net_savings'], -30.0)
+
+
+class MonthlyTrendTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('alice', password='pw')
+        self.client.force_authenticate(self.user)
+        self.food = Category.objects.create(user=self.user, name='FOOD', type='expense')
+        self.salary = Category.objects.create(user=self.user, name='INCOME', type='income')
+    
+    def add(self, category, amount, year, month, day, hour=12):
+        Expense.objects.create(
+            user=self.user, category=category, amount=Decimal(amount), description='x',
+            date=datetime(year, month, day, hour, tzinfo=dt_timezone.utc)
+        )
+    
+    def test_months_are_summed_and_zero_filled(self):
+        self.add(self.food, '10.00', 2025, 1, 9)
+        self.add(self.food, '15.00', 2025, 1, 10)
+        self.add(self.food, '20.00', 2025, 3, 1)
+        self.add(self.salary, '50.00', 2025, 3, 31, hour=23)
+        self.add(self.food, '5.00', 2025, 4, 5, hour=23)
+        self.add(self.food, '99.00', 2025, 4, 6)
+        
+        response = self.client.post(
+            reverse('tracker:analytics-monthly-trend'),
+            {'start_date': '2025-01-10', 'end_date': '2025-04-05'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [
+            {'month': 'Jan 2025', 'expenses': 15.0, 'income': 0.0, 'savings': -15.0},
+            {'month': 'Feb 2025', 'expenses': 0.0, 'income': 0.0, 'savings': 0.0},
+            {'month': 'Mar 2025', 'expenses': 20.0, 'income': 50.0, 'savings': 30.0},
+            {'month': 'Apr 2025', 'expenses': 5.0, 'income': 0.0, 'savings': -5.0},
+        ])
+
+
+class PkPaginatorTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('alice', password='pw')
+        self.category = Category.objects.create(user=self.user, name='FOOD', type='expense')
+        now = timezone.now()
+        Expense.objects.bulk_create([
+            Expense(user=self.user, category=self.category, amount=Decimal(i + 1), description=f'e{i}', date=now - timedelta(hours=i))
+            for i in range(23)
+        ])
+        self.expenses = Expense.objects.filter(user=self.user).order_by('-date')
+    
+    def test_pages_match_the_default_paginator(self):
+        for orphans in (0, 3):
+            expected = Paginator(self.expenses, 10, orphans=orphans)
+            paginator = PkPaginator(self.expenses, 10, orphans=orphans)
+            self.assertEqual(paginator.num_pages, expected.num_pages)
+            for number in expected.page_range:
+                with self.subTest(orphans=orphans, page=number):
+                    page = paginator.page(number)
+                    self.assertEqual(list(page), list(expected.page(number)))
+                    self.assertEqual(page.has_next(), expected.page(number).has_next())
+    
+    def test_page_rows_keep_the_select_related_join(self):
+        page = PkPaginator(self.expenses, 10).page(1)
+        with self.assertNumQueries(0):
+            self.assertEqual({expense.category.name for expense in page}, {'FOOD'})
+    
+    def test_expense_list_view_pages(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('tracker:expense_list'), {'page': 3})
+        self.assertEqual(response.status_code, 200)
+        page_obj = response.context['page_obj']
+        self.assertEqual(page_obj.paginator.count, 23)
+        self.assertEqual([expense.description for expense in page_obj], ['e20', 'e21', 'e22'])
+
+
+class CsvExportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('alice', password='pw')
+        self.client.force_login(self.user)
+        self.category = Category.objects.create(user=self.user, name='FOOD', type='expense')
+    
+    def download(self, name):
+        response = self.client.get(reverse(f'tracker:{name}'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        return list(csv.reader(b''.join(response.streaming_content).decode().splitlines()))
+    
+    def test_expenses_csv(self):
+        Expense.objects.create(
+            user=self.user, category=self.category, amount=Decimal('12.50'), description='Lunch, with tea',
+            payment_method='CASH', date=datetime(2026, 3, 2, 12, tzinfo=dt_timezone.utc)
+        )
+        Expense.objects.create(
+            user=self.user, category=self.category, amount=Decimal('3.00'), description='Coffee',
+            notes='Morning', date=datetime(2026, 3, 5, 12, tzinfo=dt_timezone.utc)
+        )
+        
+        self.assertEqual(self.download('export_expenses_csv'), [
+            ['Date', 'Description', 'Category', 'Amount', 'Payment Method', 'Notes'],
+            ['2026-03-05', 'Coffee', 'Food & Dining', '3.00', 'Credit/Debit Card', 'Morning'],
+            ['2026-03-02', 'Lunch, with tea', 'Food & Dining', '12.50', 'Cash', ''],
+        ])
+    
+    def test_income_csv(self):
+        Income.objects.create(
+            user=self.user, amount=Decimal('2000.00'), source='SALARY', description='March pay',
+            date=datetime(2026, 3, 1, 9, tzinfo=dt_timezone.utc), is_recurring=True, recurrence_pattern='MONTHLY'
+        )
+        Income.objects.create(
+            user=User.objects.create_user('bob', password='pw'), amount=Decimal('5.00'), description='not mine'
+        )
+        
+        self.assertEqual(self.download('export_income_csv'), [
+            ['Date', 'Source', 'Description', 'Amount', 'Recurring', 'Notes'],
+            ['2026-03-01', 'Salary', 'March pay', '2000.00', 'Yes', ''],
+        ])
+
+class CacheInvalidationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('alice', password='pw')
+        self.category = Category.objects.create(user=self.user, name='FOOD', type='expense')
+    
+    def category_keys(self):
+        return [
+            category_list_cache_key(self.user.id),
+            category_choices_cache_key(self.user.id),
+            category_choices_cache_key(self.user.id, 'expense'),
+            category_choices_cache_key(self.user.id, 'expense', limit=5),
+        ]
+    
+    def expense_keys(self):
+        return [
+            dashboard_stats_cache_key(self.user.id),
+            expense_chart_cache_key(self.user.id, 'trend'),
+            expense_chart_cache_key(self.user.id, 'category'),
+            expense_chart_cache_key(self.user.id, 'totals'),
+            expense_chart_cache_key(self.user.id, 'summary'),
+        ]
+    
+    def add_expense(self):
+        return Expense.objects.create(user=self.user, category=self.category, amount=Decimal('5.00'), description='Lunch')
+    
+    def fill(self, keys):
+        cache.set_many({key: 'stale' for key in keys})
+    
+    def assertCleared(self, keys):
+        self.assertEqual(cache.get_many(keys), {})
+    
+    def test_expense_save_clears_caches(self):
+        self.fill(self.expense_keys())
+        self.add_expense()
+        self.assertCleared(self.expense_keys())
+    
+    def test_expense_delete_clears_caches(self):
+        expense = self.add_expense()
+        self.fill(self.expense_keys())
+        expense.delete()
+        self.assertCleared(self.expense_keys())
+    
+    def test_category_delete_clears_caches_of_cascaded_expenses(self):
+        self.add_expense()
+        self.fill(self.expense_keys())
+        self.category.delete()
+        self.assertCleared(self.expense_keys())
+        self.assertFalse(Expense.objects.filter(user=self.user).exists())
+    
+    def test_category_save_clears_category_caches(self):
+        self.fill(self.category_keys())
+        self.category.color = '#ff0000'
+        self.category.save()
+        self.assertCleared(self.category_keys())
+    
+    def test_category_delete_clears_category_caches(self):
+        self.fill(self.category_keys())
+        self.category.delete()
+        self.assertCleared(self.category_keys())
+    
+    def test_category_list_reflects_new_category(self):
+        self.client.force_login(self.user)
+        url = reverse('tracker:category-list')
+        self.assertEqual(self.client.get(url).json()['count'], 1)
+        
+        Category.objects.create(user=self.user, name='TRAVEL', type='expense')
+        self.assertEqual(self.client.get(url).json()['count'], 2)
+    
+    def test_category_delete_fast_deletes_its_expenses(self):
+        Expense.objects.bulk_create([
+            Expense(user=self.user, category=self.category, amount=Decimal('5.00'), description=f'e{i}')
+            for i in range(200)
+        ])
+        with CaptureQueriesContext(connection) as queries:
+            self.category.delete()
+        
+        # One DELETE for all the expenses and one clear for the cascade, not one of each per expense
+        self.assertLess(len(queries), 20)
+        self.assertFalse(Expense.objects.filter(user=self.user).exists())
+
 
-# Create your tests here.
+class BudgetSpentTests(TestCase):
+    """with_spent() must agree with the spent_amount() fallback, including across DST changes"""
+    def setUp(self):
+        self.user = User.objects.create_user('alice', password='pw')
+        self.food = Category.objects.create(user=self.user, name='FOOD', type='expense')
+        self.travel = Category.objects.create(user=self.user, name='TRAVEL', type='expense')
+    
+    def add_expense(self, category, moment, amount='5.00'):
+        Expense.objects.create(user=self.user, category=category, amount=Decimal(amount), description='x', date=moment)
+    
+    def assertSpent(self, budget, expected):
+        annotated = Budget.objects.with_spent().get(pk=budget.pk).spent_amount()
+        fallback = Budget.objects.get(pk=budget.pk).spent_amount()
+        self.assertEqual(annotated, Decimal(expected))
+        self.assertEqual(fallback, Decimal(expected))
+    
+    def test_bounds_follow_local_dates_in_both_dst_periods(self):
+        with timezone.override(ZoneInfo('America/New_York')):
+            january = Budget.objects.create(
+                user=self.user, category=self.food, amount=Decimal('100'),
+                start_date=date(2026, 1, 1), end_date=date(2026, 1, 31)
+            )
+            july = Budget.objects.create(
+                user=self.user, category=self.travel, amount=Decimal('100'),
+                start_date=date(2026, 7, 1), end_date=date(2026, 7, 31)
+            )
+            # 23:30 local on the last day before each budget, then 00:30 local on its first day
+            self.add_expense(self.food, datetime(2026, 1, 1, 4, 30, tzinfo=dt_timezone.utc))
+            self.add_expense(self.food, datetime(2026, 1, 1, 5, 30, tzinfo=dt_timezone.utc), '7.00')
+            self.add_expense(self.travel, datetime(2026, 7, 1, 3, 30, tzinfo=dt_timezone.utc))
+            self.add_expense(self.travel, datetime(2026, 7, 1, 4, 30, tzinfo=dt_timezone.utc), '7.00')
+            # 23:30 local on each budget's last day
+            self.add_expense(self.food, datetime(2026, 2, 1, 4, 30, tzinfo=dt_timezone.utc), '11.00')
+            self.add_expense(self.travel, datetime(2026, 8, 1, 3, 30, tzinfo=dt_timezone.utc), '11.00')
+            
+            self.assertSpent(january, '18.00')
+            self.assertSpent(july, '18.00')
+    
+    def test_open_ended_budget_runs_to_today(self):
+        budget = Budget.objects.create(
+            user=self.user, category=self.food, amount=Decimal('100'),
+            start_date=timezone.now().date() - timedelta(days=10)
+        )
+        self.add_expense(self.food, timezone.now() - timedelta(days=3))
+        self.add_expense(self.food, timezone.now() - timedelta(days=20), '9.00')
+        self.add_expense(self.food, timezone.now() + timedelta(days=2), '9.00')
+        self.assertSpent(budget, '5.00')
@@ -0,0 +1,3 @@
+def month_start(moment):
+    """Midnight on the first day of moment's month, keeping its timezone"""
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
@@ -1,18 +1,25 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import login, views as auth_views, update_session_auth_hash
-from django.http import JsonResponse, HttpResponse
-from django.db.models import Sum, Count, Avg, Q
+from django.contrib.auth.models import User
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
+from django.db import DatabaseError, transaction
+from django.db.models import Sum, Count, Avg, Q, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, TruncDate, TruncMonth
 from django.utils import timezone
-from datetime import timedelta, datetime
+from django.core.cache import cache
+from datetime import timedelta, datetime, time
+from decimal import Decimal
+from itertools import islice
+from operator import itemgetter
 from django.contrib import messages
-from django.core.paginator import Paginator
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView
 from django.contrib.auth.forms import PasswordChangeForm
 from django.conf import settings
 import csv
 import json
 import io
+import logging
 
 # Make reportlab optional to avoid import errors
 try:
@@ -25,9 +32,17 @@ try:
 except ImportError:
     REPORTLAB_AVAILABLE = False
 
-from .models import Expense, Category, Budget, FinancialGoal, Income
+from .models import (
+    Expense, Category, Budget, FinancialGoal, Income,
+    EXPENSE_CHART_CACHE_TIMEOUT, clear_monthly_totals, expense_chart_cache_key
+)
+from .pagination import PkPaginator
+from .renderers import json_response
+from .utils import month_start
 from .forms import CustomUserCreationForm, ExpenseForm, BudgetForm, FinancialGoalForm, ExpenseFilterForm, IncomeForm, IncomeFilterForm
 
+logger = logging.getLogger(__name__)
+
 def index(request):
     """Landing page for non-authenticated users"""
     if request.user.is_authenticated:
@@ -44,26 +59,22 @@ def register(request):
         if form.is_valid():
             user = form.save()
             
-            # Create default categories for the new user
+            # Create default categories for the new user; labels come from Category.CATEGORY_CHOICES
             default_categories = [
-                ('FOOD', 'Food & Dining', 'expense', '#FF6B6B', 'restaurant'),
-                ('TRANSPORT', 'Transportation', 'expense', '#4ECDC4', 'directions_car'),
-                ('UTILITIES', 'Utilities', 'expense', '#45B7D1', 'flash_on'),
-                ('ENTERTAINMENT', 'Entertainment', 'expense', '#96CEB4', 'movie'),
-                ('SHOPPING', 'Shopping', 'expense', '#FFEAA7', 'shopping_cart'),
-                ('HEALTHCARE', 'Healthcare', 'expense', '#DDA0DD', 'local_hospital'),
-                ('INCOME', 'Income', 'income', '#98D8C8', 'attach_money'),
+                ('FOOD', 'expense', '#FF6B6B', 'restaurant'),
+                ('TRANSPORT', 'expense', '#4ECDC4', 'directions_car'),
+                ('UTILITIES', 'expense', '#45B7D1', 'flash_on'),
+                ('ENTERTAINMENT', 'expense', '#96CEB4', 'movie'),
+                ('SHOPPING', 'expense', '#FFEAA7', 'shopping_cart'),
+                ('HEALTHCARE', 'expense', '#DDA0DD', 'local_hospital'),
+                ('INCOME', 'income', '#98D8C8', 'attach_money'),
             ]
             
-            for code, display_name, type, color, icon in default_categories:
-                category = Category(
-                    name=code,
-                    user=user,
-                    type=type,
-                    color=color,
-                    icon=icon
-                )
-                category.save()
+            # One multi-row INSERT; the new user has no cached category data to invalidate yet
+            Category.objects.bulk_create([
+                Category(name=code, user=user, type=category_type, color=color, icon=icon)
+                for code, category_type, color, icon in default_categories
+            ])
             
             login(request, user)
             messages.success(request, 'Account created successfully! Welcome to ExpenseTracker.')
@@ -171,63 +182,59 @@ def dashboard(request):
     try:
         # Current month calculations
         today = timezone.now()
-        start_of_month = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        start_of_month = month_start(today)
         
-        # Monthly expenses and income
-        monthly_expenses_data = Expense.objects.filter(
-            user=request.user,
-            category__type='expense',
-            date__gte=start_of_month
-        ).aggregate(total=Sum('amount'))
-        monthly_expenses = monthly_expenses_data['total'] or 0
-        
-        monthly_income_data = Income.objects.filter(
-            user=request.user,
-            date__gte=start_of_month
-        ).aggregate(total=Sum('amount'))
-        monthly_income = monthly_income_data['total'] or 0
+        # Monthly income, shared with the reports page; the expense total comes from category_spending below
+        monthly_income = _current_month_totals(request.user)[0]
         
-        # Recent expenses
-        recent_expenses = Expense.objects.filter(user=request.user).select_related('category').order_by('-date')[:5]
+        # Recent expenses: only the columns the template shows, without the manager's user join
+        recent_expenses = Expense.objects.filter(user=request.user).select_related(None).select_related('category').only(
+            'amount', 'date', 'description', 'category__name', 'category__color'
+        ).order_by('-date')[:5]
         
-        # Category-wise spending
-        category_spending = Expense.objects.filter(
+        # Category-wise spending; the groups cover the whole month, so their sum is the monthly total
+        category_spending = list(Expense.objects.filter(
             user=request.user,
             category__type='expense',
             date__gte=start_of_month
         ).values('category__name', 'category__color').annotate(
             total=Sum('amount'),
             count=Count('id')
-        ).order_by('-total')
+        ).order_by('-total'))
+        monthly_expenses = sum(row['total'] for row in category_spending)
         
-        # Budget alerts
-        budget_alerts = []
-        budgets = Budget.objects.filter(user=request.user).select_related('category')
-        for budget in budgets:
-            spent = budget.spent_amount()
-            if spent > budget.amount * 0.8:  # Alert if spent more than 80% of budget
-                budget_alerts.append({
-                    'budget': budget,
-                    'spent': spent,
-                    'percentage': budget.progress_percentage()
-                })
+        # Budget alerts: only budgets more than 80% spent come back from the database
+        budget_alerts = [
+            {
+                'budget': budget,
+                'spent': budget.spent,
+                'percentage': budget.progress_percentage()
+            }
+            for budget in Budget.objects.filter(user=request.user).only('amount').with_spent().filter(
+                spent__gt=F('amount') * Decimal('0.8')
+            )
+        ]
         
-        # Financial goals
-        goals = FinancialGoal.objects.filter(user=request.user)
+        # Financial goals: the dashboard counts the unfinished ones and shows the three due soonest
+        active_goals = FinancialGoal.objects.filter(user=request.user).active()
+        goal_count = active_goals.count()
+        goals = active_goals.with_progress()[:3]
+        
+        # Weekly spending trend, summed per day in one query and zero-filled below
+        week_start = (today - timedelta(days=6)).replace(hour=0, minute=0, second=0, microsecond=0)
+        week_end = today.replace(hour=23, minute=59, second=59, microsecond=999999)
+        daily_totals = dict(Expense.objects.filter(
+            user=request.user,
+            category__type='expense',
+            date__range=[week_start, week_end]
+        ).annotate(day=TruncDate('date', tzinfo=today.tzinfo)).values('day').annotate(
+            total=Sum('amount')
+        ).values_list('day', 'total'))
         
-        # Weekly spending trend
         weekly_trend = []
         for i in range(6, -1, -1):
             day = today - timedelta(days=i)
-            day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
-            day_end = day.replace(hour=23, minute=59, second=59, microsecond=999999)
-            
-            daily_total_data = Expense.objects.filter(
-                user=request.user,
-                category__type='expense',
-                date__range=[day_start, day_end]
-            ).aggregate(total=Sum('amount'))
-            daily_total = daily_total_data['total'] or 0
+            daily_total = daily_totals.get(day.date()) or 0
             
             weekly_trend.append({
                 'day': day.strftime('%a'),
@@ -247,6 +254,7 @@ def dashboard(request):
             'category_spending': category_spending,
             'budget_alerts': budget_alerts,
             'goals': goals,
+            'goal_count': goal_count,
             'weekly_trend': weekly_trend,
             'today': today,
         }
@@ -263,6 +271,7 @@ def dashboard(request):
             'category_spending': [],
             'budget_alerts': [],
             'goals': [],
+            'goal_count': 0,
             'weekly_trend': [],
             'today': timezone.now(),
         })
@@ -273,7 +282,7 @@ def dashboard(request):
 def income_list(request):
     """List all income with filtering and pagination"""
     try:
-        incomes = Income.objects.filter(user=request.user).order_by('-date')
+        filters = Q()
         
         # Initialize filter form
         filter_form = IncomeFilterForm(request.GET)
@@ -285,38 +294,39 @@ def income_list(request):
             end_date = filter_form.cleaned_data.get('end_date')
             
             if source:
-                incomes = incomes.filter(source=source)
+                filters &= Q(source=source)
+            # Half-open aware range in the current timezone, so the (user, date) index applies
+            tz = timezone.get_current_timezone()
             if start_date:
-                incomes = incomes.filter(date__gte=timezone.make_aware(datetime.combine(start_date, datetime.min.time())))
+                filters &= Q(date__gte=datetime.combine(start_date, time.min, tzinfo=tz))
             if end_date:
-                incomes = incomes.filter(date__lte=timezone.make_aware(datetime.combine(end_date, datetime.max.time())))
+                filters &= Q(date__lt=datetime.combine(end_date + timedelta(days=1), time.min, tzinfo=tz))
         
-        # Pagination
-        paginator = Paginator(incomes, 10)
+        # Filtered totals and the unfiltered current month income in one pass over the user's rows
+        today = timezone.now()
+        stats = Income.objects.filter(user=request.user).aggregate(
+            total=Sum('amount', filter=filters or None),
+            count=Count('id', filter=filters or None),
+            monthly=Sum('amount', filter=Q(date__month=today.month, date__year=today.year))
+        )
+        total_income = stats['total'] or 0
+        income_count = stats['count']
+        monthly_income = stats['monthly'] or 0
+        
+        # Pagination; seed the paginator's count so it doesn't run its own COUNT(*)
+        incomes = Income.objects.filter(filters, user=request.user).order_by('-date')
+        paginator = PkPaginator(incomes, 10)
+        paginator.count = income_count
         page_number = request.GET.get('page')
         page_obj = paginator.get_page(page_number)
         
-        # Summary statistics
-        total_data = incomes.aggregate(total=Sum('amount'))
-        total_income = total_data['total'] or 0
-        income_count = incomes.count()
-        
-        # Current month income
-        current_month = timezone.now().month
-        current_year = timezone.now().year
-        monthly_income = Income.objects.filter(
-            user=request.user,
-            date__month=current_month,
-            date__year=current_year
-        ).aggregate(total=Sum('amount'))['total'] or 0
-        
         context = {
             'page_obj': page_obj,
             'filter_form': filter_form,
             'total_income': total_income,
             'income_count': income_count,
             'monthly_income': monthly_income,
-            'current_month': timezone.now().strftime('%B %Y'),
+            'current_month': today.strftime('%B %Y'),
         }
         return render(request, 'tracker/income_list.html', context)
     
@@ -403,7 +413,7 @@ def income_summary(request):
     ).values('source').annotate(total=Sum('amount')).order_by('-total')
     
     # Calculate total income
-    total_income = sum(item['total'] for item in income_by_source)
+    total_income = sum(map(itemgetter('total'), income_by_source))
     
     # Recurring income stats
     recurring_income = Income.objects.filter(
@@ -432,7 +442,10 @@ def income_summary(request):
 def expense_list(request):
     """List all expenses with filtering and pagination"""
     try:
-        expenses = Expense.objects.filter(user=request.user).select_related('category').order_by('-date')
+        # Only the columns the table shows, without the manager's user join
+        expenses = Expense.objects.filter(user=request.user).select_related(None).select_related('category').only(
+            'amount', 'date', 'description', 'category__name', 'category__color'
+        ).order_by('-date')
         
         # Initialize filter form
         filter_form = ExpenseFilterForm(request.GET, user=request.user)
@@ -446,23 +459,26 @@ def expense_list(request):
             
             if category:
                 expenses = expenses.filter(category=category)
+            # Half-open aware range in the current timezone, so the (user, date) index applies
+            tz = timezone.get_current_timezone()
             if start_date:
-                expenses = expenses.filter(date__gte=timezone.make_aware(datetime.combine(start_date, datetime.min.time())))
+                expenses = expenses.filter(date__gte=datetime.combine(start_date, time.min, tzinfo=tz))
             if end_date:
-                expenses = expenses.filter(date__lte=timezone.make_aware(datetime.combine(end_date, datetime.max.time())))
+                expenses = expenses.filter(date__lt=datetime.combine(end_date + timedelta(days=1), time.min, tzinfo=tz))
             if payment_method:
                 expenses = expenses.filter(payment_method=payment_method)
         
-        # Pagination
-        paginator = Paginator(expenses, 10)
+        # Summary statistics, with the row count in the same query
+        stats = expenses.aggregate(total=Sum('amount'), count=Count('id'))
+        total_expenses = stats['total'] or 0
+        expense_count = stats['count']
+        
+        # Pagination; seed the paginator's count so it doesn't run its own COUNT(*)
+        paginator = PkPaginator(expenses, 10)
+        paginator.count = expense_count
         page_number = request.GET.get('page')
         page_obj = paginator.get_page(page_number)
         
-        # Summary statistics
-        total_data = expenses.aggregate(total=Sum('amount'))
-        total_expenses = total_data['total'] or 0
-        expense_count = expenses.count()
-        
         context = {
             'page_obj': page_obj,
             'filter_form': filter_form,
@@ -532,7 +548,7 @@ def expense_delete(request, pk):
 def budget_list(request):
     """List all budgets"""
     try:
-        budgets = Budget.objects.filter(user=request.user).select_related('category')
+        budgets = Budget.objects.filter(user=request.user).select_related('category').with_spent()
         categories = Category.objects.filter(user=request.user, type='expense')
         
         # Calculate budget statistics
@@ -616,7 +632,7 @@ def budget_delete(request, pk):
 def goal_list(request):
     """List all financial goals"""
     try:
-        goals = FinancialGoal.objects.filter(user=request.user)
+        goals = FinancialGoal.objects.filter(user=request.user).with_progress()
         
         context = {
             'goals': goals,
@@ -680,32 +696,64 @@ def goal_delete(request, pk):
 
 # ===== EXPORT & REPORT VIEWS =====
 
+def _monthly_totals(user, start_of_month):
+    """Income and expense totals since start_of_month, fetched in one query"""
+    income = Income.objects.filter(
+        user=OuterRef('pk'),
+        date__gte=start_of_month
+    ).values('user').annotate(total=Sum('amount')).values('total')
+    expenses = Expense.objects.filter(
+        user=OuterRef('pk'),
+        category__type='expense',
+        date__gte=start_of_month
+    ).values('user').annotate(total=Sum('amount')).values('total')
+    
+    # Both sums ride along as scalar subqueries on the user's own row
+    return User.objects.filter(pk=user.pk).values_list(
+        Coalesce(Subquery(income), Value(Decimal('0'))),
+        Coalesce(Subquery(expenses), Value(Decimal('0')))
+    ).get()
+
+def _current_month_totals(user):
+    """This month's (income, expenses), cached until an expense, income or category is written"""
+    return cache.get_or_set(
+        expense_chart_cache_key(user.id, 'totals'),
+        lambda: _monthly_totals(user, month_start(timezone.now())),
+        EXPENSE_CHART_CACHE_TIMEOUT
+    )
+
+class Echo:
+    """Pseudo-buffer whose write() hands each CSV line straight back for streaming"""
+    def write(self, value):
+        return value
+
 @login_required
 def export_expenses_csv(request):
     """Export expenses to CSV"""
     try:
-        # Create the HttpResponse object with CSV header
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="expenses.csv"'
-        
-        # Create CSV writer
-        writer = csv.writer(response)
+        category_names = dict(Category.CATEGORY_CHOICES)
+        payment_methods = dict(Expense.PAYMENT_METHODS)
+        expenses = Expense.objects.filter(user=request.user).order_by('-date').values_list(
+            'date', 'description', 'category__name', 'amount', 'payment_method', 'notes'
+        )
         
-        # Write headers
-        writer.writerow(['Date', 'Description', 'Category', 'Amount', 'Payment Method', 'Notes'])
+        # Stream rows in chunks rather than building the whole file in memory
+        writer = csv.writer(Echo())
         
-        # Write data
-        expenses = Expense.objects.filter(user=request.user).select_related('category').order_by('-date')
-        for expense in expenses:
-            writer.writerow([
-                expense.date.strftime('%Y-%m-%d'),
-                expense.description,
-                expense.category.get_name_display(),
-                expense.amount,
-                expense.get_payment_method_display(),
-                expense.notes or ''
-            ])
+        def rows():
+            yield writer.writerow(['Date', 'Description', 'Category', 'Amount', 'Payment Method', 'Notes'])
+            for date, description, category, amount, payment_method, notes in expenses.iterator(chunk_size=2000):
+                yield writer.writerow([
+                    date.strftime('%Y-%m-%d'),
+                    description,
+                    category_names.get(category, category),
+                    amount,
+                    payment_methods.get(payment_method, payment_method),
+                    notes or ''
+                ])
         
+        response = StreamingHttpResponse(rows(), content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="expenses.csv"'
         return response
     
     except Exception as e:
@@ -716,23 +764,27 @@ def export_expenses_csv(request):
 def export_income_csv(request):
     """Export income to CSV"""
     try:
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="income.csv"'
+        income_sources = dict(Income.INCOME_SOURCES)
+        incomes = Income.objects.filter(user=request.user).order_by('-date').values_list(
+            'date', 'source', 'description', 'amount', 'is_recurring', 'notes'
+        )
         
-        writer = csv.writer(response)
-        writer.writerow(['Date', 'Source', 'Description', 'Amount', 'Recurring', 'Notes'])
+        writer = csv.writer(Echo())
         
-        incomes = Income.objects.filter(user=request.user).order_by('-date')
-        for income in incomes:
-            writer.writerow([
-                income.date.strftime('%Y-%m-%d'),
-                income.get_source_display(),
-                income.description,
-                income.amount,
-                'Yes' if income.is_recurring else 'No',
-                income.notes or ''
-            ])
+        def rows():
+            yield writer.writerow(['Date', 'Source', 'Description', 'Amount', 'Recurring', 'Notes'])
+            for date, source, description, amount, is_recurring, notes in incomes.iterator(chunk_size=2000):
+                yield writer.writerow([
+                    date.strftime('%Y-%m-%d'),
+                    income_sources.get(source, source),
+                    description,
+                    amount,
+                    'Yes' if is_recurring else 'No',
+                    notes or ''
+                ])
         
+        response = StreamingHttpResponse(rows(), content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="income.csv"'
         return response
     
     except Exception as e:
@@ -763,22 +815,8 @@ def export_financial_report_pdf(request):
         
         elements.append(Paragraph("<br/>", styles['Normal']))
         
-        # Current month data
-        today = timezone.now()
-        start_of_month = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        
-        # Income data
-        monthly_income = Income.objects.filter(
-            user=request.user,
-            date__gte=start_of_month
-        ).aggregate(total=Sum('amount'))['total'] or 0
-        
-        # Expense data
-        monthly_expenses = Expense.objects.filter(
-            user=request.user,
-            category__type='expense',
-            date__gte=start_of_month
-        ).aggregate(total=Sum('amount'))['total'] or 0
+        # Current month income and expense data
+        monthly_income, monthly_expenses = _current_month_totals(request.user)
         
         # Summary table
         summary_data = [
@@ -826,19 +864,7 @@ def export_financial_report_pdf(request):
 def financial_reports(request):
     """Financial reports dashboard"""
     # Get current month data for the reports page
-    today = timezone.now()
-    start_of_month = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    
-    monthly_income = Income.objects.filter(
-        user=request.user,
-        date__gte=start_of_month
-    ).aggregate(total=Sum('amount'))['total'] or 0
-    
-    monthly_expenses = Expense.objects.filter(
-        user=request.user,
-        category__type='expense',
-        date__gte=start_of_month
-    ).aggregate(total=Sum('amount'))['total'] or 0
+    monthly_income, monthly_expenses = _current_month_totals(request.user)
     
     monthly_savings = monthly_income - monthly_expenses
     savings_rate = (monthly_savings / monthly_income * 100) if monthly_income > 0 else 0
@@ -858,119 +884,150 @@ def financial_reports(request):
 def expense_chart_data(request):
     """API endpoint for expense chart data"""
     try:
-        # Last 6 months spending data
-        data = []
-        today = timezone.now()
-        
-        for i in range(5, -1, -1):
-            month_start = today.replace(day=1) - timedelta(days=30*i)
-            next_month = month_start + timedelta(days=32)
-            month_end = next_month.replace(day=1) - timedelta(days=1)
-            
-            total_data = Expense.objects.filter(
-                user=request.user,
-                category__type='expense',
-                date__range=[month_start, month_end]
-            ).aggregate(total=Sum('amount'))
-            total = total_data['total'] or 0
-            
-            data.append({
-                'month': month_start.strftime('%b %Y'),
-                'amount': float(total)
-            })
-        
-        return JsonResponse(data, safe=False)
+        # Served from the cache until the month changes or an expense or category is written
+        data = cache.get_or_set(
+            expense_chart_cache_key(request.user.id, 'trend'),
+            lambda: _expense_trend_chart(request.user),
+            EXPENSE_CHART_CACHE_TIMEOUT
+        )
+        return json_response(data)
     
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=400)
+    except DatabaseError:
+        # Log the details server-side; the client only learns that the data is unavailable
+        logger.exception('Could not load expense chart data for user %s', request.user.id)
+        return JsonResponse({'error': 'Could not load expense chart data.'}, status=503)
+
+def _expense_trend_chart(user):
+    """Spending for each of the last six calendar months"""
+    today = timezone.now()
+    
+    # First day of this month and the five before it
+    months = []
+    current = month_start(today)
+    year, month = today.year, today.month
+    for _ in range(6):
+        months.insert(0, current.replace(year=year, month=month))
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+    
+    monthly_totals = dict(Expense.objects.filter(
+        user=user,
+        category__type='expense',
+        date__gte=months[0]
+    ).annotate(month=TruncMonth('date', tzinfo=today.tzinfo)).values('month').annotate(
+        total=Sum('amount')
+    ).values_list('month', 'total'))
+    
+    data = []
+    for first_day in months:
+        data.append({
+            'month': first_day.strftime('%b %Y'),
+            'amount': float(monthly_totals.get(first_day) or 0)
+        })
+    
+    return data
 
 @login_required
 def category_chart_data(request):
     """API endpoint for category chart data"""
     try:
-        today = timezone.now()
-        start_of_month = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        
-        data = Expense.objects.filter(
-            user=request.user,
-            category__type='expense',
-            date__gte=start_of_month
-        ).values('category__name', 'category__color').annotate(
-            total=Sum('amount')
-        ).order_by('-total')
-        
-        chart_data = {
-            'labels': [item['category__name'] for item in data],
-            'data': [float(item['total']) for item in data],
-            'colors': [item['category__color'] for item in data],
-        }
-        
-        return JsonResponse(chart_data)
+        # Served from the cache until the month changes or an expense or category is written
+        chart_data = cache.get_or_set(
+            expense_chart_cache_key(request.user.id, 'category'),
+            lambda: _category_spending_chart(request.user),
+            EXPENSE_CHART_CACHE_TIMEOUT
+        )
+        return json_response(chart_data)
     
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=400)
+    except DatabaseError:
+        logger.exception('Could not load category chart data for user %s', request.user.id)
+        return JsonResponse({'error': 'Could not load category chart data.'}, status=503)
+
+def _category_spending_chart(user):
+    """This month's spending per category"""
+    today = timezone.now()
+    start_of_month = month_start(today)
+    
+    data = Expense.objects.filter(
+        user=user,
+        category__type='expense',
+        date__gte=start_of_month
+    ).values('category__name', 'category__color').annotate(
+        total=Sum('amount')
+    ).order_by('-total')
+    
+    return {
+        'labels': [item['category__name'] for item in data],
+        'data': [float(item['total']) for item in data],
+        'colors': [item['category__color'] for item in data],
+    }
 
 @login_required
 def budget_progress_data(request):
     """API endpoint for budget progress data"""
     try:
-        budgets = Budget.objects.filter(user=request.user).select_related('category')
-        
-        data = []
-        for budget in budgets:
-            spent = budget.spent_amount()
-            data.append({
-                'category': budget.category.get_name_display(),
-                'budget': float(budget.amount),
-                'spent': float(spent),
-                'remaining': float(budget.remaining_amount()),
-                'percentage': budget.progress_percentage()
-            })
-        
-        return JsonResponse(data, safe=False)
+        # Served from the cache until the month changes or an expense, category or budget is written
+        data = cache.get_or_set(
+            expense_chart_cache_key(request.user.id, 'budget'),
+            lambda: _budget_progress_chart(request.user),
+            EXPENSE_CHART_CACHE_TIMEOUT
+        )
+        return json_response(data)
     
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=400)
+    except DatabaseError:
+        logger.exception('Could not load budget progress data for user %s', request.user.id)
+        return JsonResponse({'error': 'Could not load budget progress data.'}, status=503)
+
+def _budget_progress_chart(user):
+    """Amount, spending and progress for each of the user's budgets"""
+    # Plain rows instead of model instances; labels come from the choices, not the database
+    category_labels = dict(Category.CATEGORY_CHOICES)
+    rows = Budget.objects.filter(user=user).with_spent().values_list('category__name', 'amount', 'spent')
+    
+    data = []
+    for name, amount, spent in rows:
+        data.append({
+            'category': category_labels.get(name, name),
+            'budget': float(amount),
+            'spent': float(spent),
+            'remaining': float(amount - spent),
+            'percentage': min(spent * 100 / amount, 100) if amount > 0 else 0
+        })
+    
+    return data
 
 @login_required
 def financial_summary(request):
     """API endpoint for financial summary"""
     try:
-        today = timezone.now()
-        start_of_month = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        
-        # Monthly totals
-        monthly_expenses_data = Expense.objects.filter(
-            user=request.user,
-            category__type='expense',
-            date__gte=start_of_month
-        ).aggregate(total=Sum('amount'))
-        monthly_expenses = monthly_expenses_data['total'] or 0
-        
-        monthly_income_data = Income.objects.filter(
-            user=request.user,
-            date__gte=start_of_month
-        ).aggregate(total=Sum('amount'))
-        monthly_income = monthly_income_data['total'] or 0
-        
-        # Budget summary
-        total_budget_data = Budget.objects.filter(user=request.user).aggregate(total=Sum('amount'))
-        total_budget = total_budget_data['total'] or 0
-        
-        total_spent = sum(budget.spent_amount() for budget in Budget.objects.filter(user=request.user))
-        
-        summary = {
-            'monthly_expenses': float(monthly_expenses),
-            'monthly_income': float(monthly_income),
-            'total_budget': float(total_budget),
-            'total_spent': float(total_spent),
-            'savings': float(monthly_income - monthly_expenses),
-        }
-        
-        return JsonResponse(summary)
+        # Served from the cache until the month changes or an expense, income, category or budget is written
+        summary = cache.get_or_set(
+            expense_chart_cache_key(request.user.id, 'summary'),
+            lambda: _financial_summary(request.user),
+            EXPENSE_CHART_CACHE_TIMEOUT
+        )
+        return json_response(summary)
     
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=400)
+    except DatabaseError:
+        logger.exception('Could not load financial summary for user %s', request.user.id)
+        return JsonResponse({'error': 'Could not load financial summary.'}, status=503)
+
+def _financial_summary(user):
+    """This month's income and expenses plus the budget totals"""
+    # Monthly totals, shared with the dashboard and reports page
+    monthly_income, monthly_expenses = _current_month_totals(user)
+    
+    # Budget summary; amounts and annotated spending come back in one query
+    budget_rows = Budget.objects.filter(user=user).with_spent().values_list('amount', 'spent')
+    total_budget = sum(amount for amount, spent in budget_rows)
+    total_spent = sum(spent for amount, spent in budget_rows)
+    
+    return {
+        'monthly_expenses': float(monthly_expenses),
+        'monthly_income': float(monthly_income),
+        'total_budget': float(total_budget),
+        'total_spent': float(total_spent),
+        'savings': float(monthly_income - monthly_expenses),
+    }
 
 # ===== PASSWORD RESET VIEWS =====
 
@@ -998,47 +1055,57 @@ def process_recurring_transactions(request):
         messages.error(request, "Access denied.")
         return redirect('tracker:dashboard')
     
+    # The sweep covers every user, so it runs at most once a day however often this is hit
+    now = timezone.now()
+    sweep_key = f'recurring_sweep:{now.date().isoformat()}'
+    if not cache.add(sweep_key, True, 60 * 60 * 24):
+        messages.info(request, "Recurring transactions have already been processed today.")
+        return redirect('tracker:dashboard')
+    
     try:
-        today = timezone.now().date()
-        processed_count = 0
-        
-        # Process recurring income
-        recurring_incomes = Income.objects.filter(
-            is_recurring=True,
-            recurrence_pattern__in=['DAILY', 'WEEKLY', 'MONTHLY', 'YEARLY']
+        # Income.objects.due() applies the recurrence rules in SQL; the new rows go in 500 per INSERT
+        today = now.date()
+        due_rows = Income.objects.due(today).order_by().values_list(
+            'id', 'user_id', 'amount', 'source', 'description', 'notes'
         )
+        processed_ids = []
         
-        for income in recurring_incomes:
-            last_occurrence = income.date.date()
-            should_create = False
-            
-            if income.recurrence_pattern == 'DAILY':
-                should_create = (today - last_occurrence).days >= 1
-            elif income.recurrence_pattern == 'WEEKLY':
-                should_create = (today - last_occurrence).days >= 7
-            elif income.recurrence_pattern == 'MONTHLY':
-                should_create = today.month != last_occurrence.month or today.year != last_occurrence.year
-            elif income.recurrence_pattern == 'YEARLY':
-                should_create = today.year != last_occurrence.year
-            
-            if should_create:
-                # Create new income record
-                new_income = Income(
-                    user=income.user,
-                    amount=income.amount,
-                    source=income.source,
-                    description=f"Recurring: {income.description}",
-                    date=timezone.now(),
-                    is_recurring=True,
-                    recurrence_pattern=income.recurrence_pattern,
-                    notes=income.notes
+        def new_incomes():
+            for pk, user_id, amount, source, description, notes in due_rows.iterator(chunk_size=500):
+                processed_ids.append(pk)
+                # The original keeps the schedule; each generated occurrence is a plain one-off income
+                yield Income(
+                    user_id=user_id,
+                    amount=amount,
+                    source=source,
+                    description=f"Recurring: {description}",
+                    date=now,
+                    notes=notes
                 )
-                new_income.save()
-                processed_count += 1
+        
+        # Read and write in batches so memory stays flat, committing the whole sweep once
+        processed_count = 0
+        user_ids = set()
+        occurrences = new_incomes()
+        with transaction.atomic():
+            while batch := list(islice(occurrences, 500)):
+                Income.objects.bulk_create(batch)
+                processed_count += len(batch)
+                user_ids.update(income.user_id for income in batch)
+            
+            # Stamp the originals once the read is finished, so the next sweep skips them until they fall due again
+            for start in range(0, len(processed_ids), 500):
+                Income.objects.filter(pk__in=processed_ids[start:start + 500]).update(last_processed_date=today)
+        
+        # bulk_create sends no post_save, so clear the cached monthly figures by hand
+        for user_id in user_ids:
+            clear_monthly_totals(user_id)
         
         messages.success(request, f"Processed {processed_count} recurring transactions.")
         
     except Exception as e:
+        # Nothing was committed, so let the next call try again
+        cache.delete(sweep_key)
         messages.error(request, f"Error processing recurring transactions: {str(e)}")
     
     return redirect('tracker:dashboard')
\ No newline at end of file